@@ -0,0 +1,72 @@
+"""initial schema
+
+기존에 Base.metadata로 만들어 쓰던 스키마를 기준점으로 기록합니다.
+테이블이 이미 있는 DB는 `alembic stamp 0001`로 표시한 뒤 이후 마이그레이션을 적용합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-10-20 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String(50), nullable=False),
+        sa.Column("email", sa.String(100), nullable=False),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("action", sa.String(50), nullable=False),
+        sa.Column("resource", sa.String(100), nullable=False),
+        sa.Column("details", sa.Text(), nullable=True),
+        sa.Column("ip_address", sa.String(45), nullable=True),
+        sa.Column("user_agent", sa.String(255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_audit_logs_id", "audit_logs", ["id"])
+    op.create_index("ix_audit_logs_action", "audit_logs", ["action"])
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+
+    op.create_table(
+        "error_logs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service_name", sa.String(100), nullable=False),
+        sa.Column("error_type", sa.String(100), nullable=False),
+        sa.Column("error_message", sa.Text(), nullable=False),
+        sa.Column("stack_trace", sa.Text(), nullable=True),
+        sa.Column("request_path", sa.String(255), nullable=True),
+        sa.Column("request_method", sa.String(10), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("severity", sa.String(20), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_error_logs_id", "error_logs", ["id"])
+    op.create_index("ix_error_logs_service_name", "error_logs", ["service_name"])
+    op.create_index("ix_error_logs_severity", "error_logs", ["severity"])
+    op.create_index("ix_error_logs_created_at", "error_logs", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("error_logs")
+    op.drop_table("audit_logs")
+    op.drop_table("users")
@@ -0,0 +1,61 @@
+"""composite indexes for log tables
+
+"WHERE service_name = ? ORDER BY created_at DESC" 같은 대시보드 조회가
+정렬 없이 인덱스 한 번으로 끝나도록 (조건 컬럼, created_at) 복합 인덱스를 추가하고,
+선두 컬럼이 같은 단일 컬럼 인덱스는 제거합니다.
+운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성/삭제합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-10-20 00:00:00
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_error_logs_service_created", "error_logs", ["service_name", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_error_logs_severity_created", "error_logs", ["severity", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_audit_logs_action_created", "audit_logs", ["action", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_error_logs_service_name", "error_logs", postgresql_concurrently=True)
+        op.drop_index("ix_error_logs_severity", "error_logs", postgresql_concurrently=True)
+        op.drop_index("ix_audit_logs_action", "audit_logs", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_action", "audit_logs", ["action"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_error_logs_severity", "error_logs", ["severity"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_error_logs_service_name", "error_logs", ["service_name"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_audit_logs_action_created", "audit_logs", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_error_logs_severity_created", "error_logs", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_error_logs_service_created", "error_logs", postgresql_concurrently=True
+        )
@@ -0,0 +1,42 @@
+"""user foreign keys on log tables
+
+audit_logs / error_logs의 user_id에 users.id 외래 키(삭제 시 NULL)와 인덱스를 추가합니다.
+사용자별 로그 조회와 사용자 JOIN이 인덱스를 타도록 하기 위함입니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-10-20 00:00:00
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_user_id", "audit_logs", ["user_id"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_error_logs_user_id", "error_logs", ["user_id"], postgresql_concurrently=True
+        )
+    op.create_foreign_key(
+        "fk_audit_logs_user_id_users", "audit_logs", "users",
+        ["user_id"], ["id"], ondelete="SET NULL",
+    )
+    op.create_foreign_key(
+        "fk_error_logs_user_id_users", "error_logs", "users",
+        ["user_id"], ["id"], ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("fk_error_logs_user_id_users", "error_logs", type_="foreignkey")
+    op.drop_constraint("fk_audit_logs_user_id_users", "audit_logs", type_="foreignkey")
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_error_logs_user_id", "error_logs", postgresql_concurrently=True)
+        op.drop_index("ix_audit_logs_user_id", "audit_logs", postgresql_concurrently=True)
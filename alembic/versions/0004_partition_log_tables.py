@@ -0,0 +1,112 @@
+"""partition log tables by month
+
+audit_logs / error_logs를 created_at 기준 월별 RANGE 파티션 테이블로 바꿉니다.
+보관 기간이 지난 로그를 DELETE + VACUUM 대신 파티션 DROP으로 정리하기 위함입니다.
+
+파티션 테이블의 PK는 파티션 키를 포함해야 하므로 (id, created_at)로 바꾸고,
+created_at은 NOT NULL이 됩니다 (NULL이었던 행은 마이그레이션 시각으로 채움).
+기존 데이터가 있는 달부터 2개월 뒤까지 월별 파티션을 만들고, 범위를 벗어난 행을 위한
+default 파티션을 둡니다. 이후 파티션 생성/삭제는 tasks.cleanup_old_logs가 매일 수행합니다.
+
+테이블 전체를 새 테이블로 복사하므로 ACCESS EXCLUSIVE 잠금이 걸립니다. 점검 시간에 실행하세요.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-10-20 00:00:00
+"""
+from alembic import op
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# 테이블별 (인덱스 이름, 컬럼) 및 users 외래 키 이름
+_INDEXES = {
+    "audit_logs": (
+        ("ix_audit_logs_id", ["id"]),
+        ("ix_audit_logs_created_at", ["created_at"]),
+        ("ix_audit_logs_action_created", ["action", "created_at"]),
+        ("ix_audit_logs_user_id", ["user_id"]),
+    ),
+    "error_logs": (
+        ("ix_error_logs_id", ["id"]),
+        ("ix_error_logs_created_at", ["created_at"]),
+        ("ix_error_logs_service_created", ["service_name", "created_at"]),
+        ("ix_error_logs_severity_created", ["severity", "created_at"]),
+        ("ix_error_logs_user_id", ["user_id"]),
+    ),
+}
+_USER_FKS = {
+    "audit_logs": "fk_audit_logs_user_id_users",
+    "error_logs": "fk_error_logs_user_id_users",
+}
+
+# 미리 만들어 둘 월별 파티션 수 (tasks.LOG_PARTITION_MONTHS_AHEAD와 동일)
+_MONTHS_AHEAD = 2
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    """
+    table을 같은 컬럼의 새 테이블로 다시 만들고 데이터를 옮김
+    id 시퀀스는 새 테이블로 소유권을 넘겨 기존 번호를 이어서 사용한다.
+    """
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+
+    if partitioned:
+        op.execute(f"UPDATE {old} SET created_at = now() WHERE created_at IS NULL")
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL")
+        op.execute(f"""
+            DO $$
+            DECLARE
+                m date := date_trunc(
+                    'month', COALESCE((SELECT min(created_at) FROM {old}), now()) AT TIME ZONE 'UTC'
+                )::date;
+                last_month date := (
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{_MONTHS_AHEAD} months'
+                )::date;
+            BEGIN
+                WHILE m <= last_month LOOP
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                        '{table}_' || to_char(m, 'YYYY_MM'),
+                        m::timestamp AT TIME ZONE 'UTC',
+                        (m + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                    );
+                    m := (m + interval '1 month')::date;
+                END LOOP;
+            END $$;
+        """)
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    else:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    # 파티션 테이블을 지우면 파티션도 함께 삭제됨
+    op.execute(f"DROP TABLE {old}")
+
+    op.create_primary_key(
+        f"{table}_pkey", table, ["id", "created_at"] if partitioned else ["id"]
+    )
+    for name, columns in _INDEXES[table]:
+        op.create_index(name, table, columns)
+    op.create_foreign_key(
+        _USER_FKS[table], table, "users", ["user_id"], ["id"], ondelete="SET NULL"
+    )
+
+
+def upgrade() -> None:
+    _rebuild("audit_logs", partitioned=True)
+    _rebuild("error_logs", partitioned=True)
+
+
+def downgrade() -> None:
+    _rebuild("error_logs", partitioned=False)
+    _rebuild("audit_logs", partitioned=False)
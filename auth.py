@@ -1,22 +1,50 @@
 """
 JWT 기반 인증 및 권한 관리 모듈
 """
+import hashlib
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
 
+from cache_utils import SimpleCache
+from config import settings
+
 # 설정
 SECRET_KEY = "your-secret-key-change-this-in-production"
 ALGORITHM = "HS256"
+# HMAC 키 바이트는 한 번만 인코딩해 재사용
+_SECRET = SECRET_KEY.encode("utf-8")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+TOKEN_CACHE_TTL = 60
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+_CREDENTIALS_DETAIL = "인증 정보를 검증할 수 없습니다"
+_CREDENTIALS_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _credentials_exception() -> HTTPException:
+    """
+    인증 실패 예외 생성
+    raise 시 __traceback__/__context__가 예외 객체에 기록되므로 동시 요청 간에
+    공유하지 않도록 매번 새로 만든다.
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=_CREDENTIALS_DETAIL,
+        headers=_CREDENTIALS_HEADERS,
+    )
+
+
+# 디코딩된 JWT 페이로드 캐시 (같은 토큰의 반복 HMAC 검증 방지)
+token_cache = SimpleCache(default_ttl=TOKEN_CACHE_TTL)
+
 
 class Token(BaseModel):
     """토큰 응답 모델"""
@@ -42,14 +70,32 @@ class UserInDB(User):
     hashed_password: str
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
+@dataclass(slots=True, frozen=True)
+class UserContext:
+    """
+    인증된 사용자 컨텍스트 (의존성 간 내부 전달용)
+    JWT 서명으로 이미 검증된 값이므로 Pydantic 검증을 거치지 않음.
+    응답으로 내보낼 때만 User 모델로 변환합니다.
+    """
+    username: str
+    disabled: bool = False
+
+
+def verify_password(plain_password: str, hashed_password: str | bytes) -> bool:
+    """비밀번호 검증 (bcrypt C 바인딩 직접 호출)"""
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode("utf-8")
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password)
+    except ValueError:
+        # 잘못된 형식의 해시는 검증 실패로 처리
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
-    return pwd_context.hash(password)
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=settings.bcrypt_cost))
+    return hashed.decode("utf-8")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -60,36 +106,59 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    """현재 인증된 사용자 조회"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="인증 정보를 검증할 수 없습니다",
-        headers={"WWW-Authenticate": "Bearer"},
+def _token_cache_key(token: str) -> str:
+    """토큰 원문 대신 고정 길이 다이제스트를 캐시 키로 사용"""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def decode_access_token(token: str) -> dict:
+    """JWT 디코딩 (만료 시각까지 결과 캐싱)"""
+    cache_key = _token_cache_key(token)
+    payload = token_cache.get(cache_key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(
+        token,
+        _SECRET,
+        algorithms=[ALGORITHM],
+        options={"require": ["exp"], "verify_signature": True},
     )
+
+    ttl = TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        token_cache.set(cache_key, payload, ttl=ttl)
+    return payload
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserContext:
+    """현재 인증된 사용자 조회"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
+        payload = decode_access_token(token)
+    except jwt.InvalidTokenError:
+        raise _credentials_exception() from None
+
+    username: str = payload.get("sub")
+    if username is None:
+        raise _credentials_exception()
 
     # 여기서 실제로는 DB에서 사용자 조회
-    # user = get_user(fake_users_db, username=token_data.username)
+    # user = get_user(fake_users_db, username=username)
     # if user is None:
-    #     raise credentials_exception
+    #     raise _credentials_exception()
     # return user
 
-    return User(username=token_data.username)
+    return UserContext(username=username)
 
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)):
+async def get_current_active_user(current_user: UserContext = Depends(get_current_user)):
     """활성화된 사용자 확인"""
     if current_user.disabled:
         raise HTTPException(status_code=400, detail="비활성화된 사용자입니다")
@@ -1,27 +1,66 @@
 """
-Simple in-memory cache utility for API responses
+Cache utilities for API responses
+In-memory TTL cache and a Redis-backed shared cache fronted by it
 """
+import asyncio
+import itertools
+import json
+import logging
+import os
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from logger_config import get_logger
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from config import settings
+from logger_config import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
+# Redis calls must fail fast so a slow or unreachable server degrades to a
+# cache miss instead of stalling the request (seconds)
+REDIS_CONNECT_TIMEOUT = 0.25
+REDIS_SOCKET_TIMEOUT = 0.25
+
 
 class SimpleCache:
-    """In-memory cache with TTL support"""
+    """In-memory LRU cache with TTL support"""
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, max_size: Optional[int] = None):
         """
         Initialize cache
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 5 minutes)
+            max_size: Maximum number of entries (default: settings.cache_max_size)
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Values and expiry times are kept in parallel maps so that
+        # cleanup_expired only has to scan the compact expiry floats.
+        # _cache is ordered from least to most recently used.
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._expires: Dict[str, float] = {}
         self.default_ttl = default_ttl
-        self.hits = 0
-        self.misses = 0
+        self.max_size = max_size if max_size is not None else settings.cache_max_size
+        # next() on itertools.count is a single C call, so concurrent
+        # increments from threads are never lost (unlike "+= 1")
+        self._hits = itertools.count()
+        self._misses = itertools.count()
+
+    @staticmethod
+    def _counter_value(counter: "itertools.count") -> int:
+        """Read the current value of an itertools.count without advancing it"""
+        # repr is "count(N)"
+        return int(repr(counter)[6:-1])
+
+    @property
+    def hits(self) -> int:
+        """Number of cache hits"""
+        return self._counter_value(self._hits)
+
+    @property
+    def misses(self) -> int:
+        """Number of cache misses (including expired entries)"""
+        return self._counter_value(self._misses)
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -33,22 +72,28 @@ class SimpleCache:
         Returns:
             Cached value if exists and not expired, None otherwise
         """
-        if key not in self._cache:
-            self.misses += 1
-            logger.debug("cache_miss", context={"key": key})
+        expires_at = self._expires.get(key)
+        if expires_at is None:
+            next(self._misses)
+            if is_enabled_for(logging.DEBUG):
+                logger.debug("cache_miss", context={"key": key})
             return None
 
-        entry = self._cache[key]
-        if time.time() > entry["expires_at"]:
+        if time.monotonic() > expires_at:
             # Expired
             del self._cache[key]
-            self.misses += 1
-            logger.debug("cache_expired", context={"key": key})
+            del self._expires[key]
+            next(self._misses)
+            if is_enabled_for(logging.DEBUG):
+                logger.debug("cache_expired", context={"key": key})
             return None
 
-        self.hits += 1
-        logger.debug("cache_hit", context={"key": key})
-        return entry["value"]
+        cache = self._cache
+        cache.move_to_end(key)
+        next(self._hits)
+        if is_enabled_for(logging.DEBUG):
+            logger.debug("cache_hit", context={"key": key})
+        return cache[key]
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -60,40 +105,49 @@ class SimpleCache:
             ttl: Time-to-live in seconds (uses default if not specified)
         """
         ttl = ttl if ttl is not None else self.default_ttl
-        self._cache[key] = {
-            "value": value,
-            "expires_at": time.time() + ttl,
-            "created_at": time.time()
-        }
-        logger.debug(
-            "cache_set",
-            context={"key": key, "ttl": ttl}
-        )
+        cache = self._cache
+        cache[key] = value
+        cache.move_to_end(key)
+        self._expires[key] = time.monotonic() + ttl
+
+        # LRU eviction
+        while len(cache) > self.max_size:
+            evicted_key, _ = cache.popitem(last=False)
+            del self._expires[evicted_key]
+
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "cache_set",
+                context={"key": key, "ttl": ttl}
+            )
 
     def delete(self, key: str) -> None:
         """Delete key from cache"""
-        if key in self._cache:
+        if self._expires.pop(key, None) is not None:
             del self._cache[key]
-            logger.debug("cache_delete", context={"key": key})
+            if is_enabled_for(logging.DEBUG):
+                logger.debug("cache_delete", context={"key": key})
 
     def clear(self) -> None:
         """Clear all cache entries"""
         count = len(self._cache)
         self._cache.clear()
-        self.hits = 0
-        self.misses = 0
+        self._expires.clear()
+        self._hits = itertools.count()
+        self._misses = itertools.count()
         logger.info("cache_cleared", context={"entries_cleared": count})
 
     def cleanup_expired(self) -> int:
         """Remove expired entries from cache"""
-        current_time = time.time()
+        current_time = time.monotonic()
         expired_keys = [
-            key for key, entry in self._cache.items()
-            if current_time > entry["expires_at"]
+            key for key, expires_at in self._expires.items()
+            if current_time > expires_at
         ]
 
         for key in expired_keys:
             del self._cache[key]
+            del self._expires[key]
 
         if expired_keys:
             logger.info(
@@ -103,15 +157,29 @@ class SimpleCache:
 
         return len(expired_keys)
 
+    async def run_janitor(self, interval: Optional[float] = None) -> None:
+        """
+        Periodically remove expired entries (run as a background task)
+
+        Args:
+            interval: Seconds between cleanups (default: default_ttl / 4)
+        """
+        interval = interval if interval is not None else self.default_ttl / 4
+        while True:
+            await asyncio.sleep(interval)
+            self.cleanup_expired()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        total_requests = self.hits + self.misses
-        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+        hits = self.hits
+        misses = self.misses
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
 
         return {
             "entries": len(self._cache),
-            "hits": self.hits,
-            "misses": self.misses,
+            "hits": hits,
+            "misses": misses,
             "hit_rate": round(hit_rate, 2),
             "total_requests": total_requests
         }
@@ -126,3 +194,106 @@ class SimpleCache:
             "estimated_bytes": total_size,
             "estimated_mb": round(total_size / (1024 * 1024), 2)
         }
+
+
+class RedisCache:
+    """Redis-backed cache shared by all workers, with an in-process L1 tier"""
+
+    def __init__(self, default_ttl: int = 300, l1_ttl: int = 5, prefix: str = "cache:"):
+        """
+        Initialize cache
+
+        Args:
+            default_ttl: Default time-to-live in Redis in seconds (default: 5 minutes)
+            l1_ttl: Maximum time-to-live of the in-process copy in seconds
+            prefix: Key prefix used in Redis
+        """
+        self.default_ttl = default_ttl
+        self.l1_ttl = l1_ttl
+        self.prefix = prefix
+        self.l1 = SimpleCache(default_ttl=l1_ttl)
+        self._pool = aioredis.ConnectionPool.from_url(
+            f"redis://{settings.redis_host}:{settings.redis_port}",
+            max_connections=(os.cpu_count() or 1) * 2 + 2,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            retry_on_timeout=True,
+        )
+        self._redis = aioredis.Redis(connection_pool=self._pool)
+
+    @property
+    def client(self) -> aioredis.Redis:
+        """Underlying Redis client (shares this cache's connection pool)"""
+        return self._redis
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from L1, falling back to Redis
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if exists and not expired, None otherwise
+        """
+        value = self.l1.get(key)
+        if value is not None:
+            return value
+
+        try:
+            raw = await self._redis.get(self.prefix + key)
+        except RedisError as exc:
+            logger.warning(
+                "redis_cache_unavailable",
+                context={"operation": "get", "key": key, "error": str(exc)}
+            )
+            return None
+
+        if raw is None:
+            return None
+
+        value = json.loads(raw)
+        self.l1.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Set value in Redis and L1
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+            ttl: Time-to-live in seconds (uses default if not specified)
+        """
+        ttl = ttl if ttl is not None else self.default_ttl
+        self.l1.set(key, value, ttl=min(ttl, self.l1_ttl))
+        try:
+            await self._redis.set(self.prefix + key, json.dumps(value), ex=ttl)
+        except RedisError as exc:
+            logger.warning(
+                "redis_cache_unavailable",
+                context={"operation": "set", "key": key, "error": str(exc)}
+            )
+
+    async def delete(self, key: str) -> None:
+        """Delete key from Redis and L1"""
+        self.l1.delete(key)
+        try:
+            await self._redis.delete(self.prefix + key)
+        except RedisError as exc:
+            logger.warning(
+                "redis_cache_unavailable",
+                context={"operation": "delete", "key": key, "error": str(exc)}
+            )
+
+    async def run_janitor(self, interval: Optional[float] = None) -> None:
+        """Periodically remove expired L1 entries (Redis expires keys itself)"""
+        await self.l1.run_janitor(interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get L1 cache statistics"""
+        return self.l1.get_stats()
+
+    async def close(self) -> None:
+        """Close Redis connections"""
+        await self._pool.disconnect()
@@ -3,37 +3,93 @@
 환경 변수 기반 설정
 """
 import os
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Any, FrozenSet, Optional
 
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-class Settings:
-    """애플리케이션 설정 클래스"""
 
-    def __init__(self):
-        self.app_name: str = os.getenv("APP_NAME", "fastapi-service")
-        self.app_version: str = os.getenv("APP_VERSION", "1.0.0")
-        self.environment: str = os.getenv("ENVIRONMENT", "production")
-        self.debug_mode: bool = os.getenv("DEBUG", "false").lower() == "true"
+class Settings(BaseSettings):
+    """애플리케이션 설정 클래스 (환경 변수 / .env에서 로드, 불변)"""
 
-        # 데이터베이스 설정
-        self.db_host: str = os.getenv("DB_HOST", "localhost")
-        self.db_port: int = int(os.getenv("DB_PORT", "5432"))
-        self.db_name: str = os.getenv("DB_NAME", "app_db")
-        self.db_user: str = os.getenv("DB_USER", "postgres")
-        self.db_password: Optional[str] = os.getenv("DB_PASSWORD")
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
 
-        # Redis 설정
-        self.redis_host: str = os.getenv("REDIS_HOST", "localhost")
-        self.redis_port: int = int(os.getenv("REDIS_PORT", "6379"))
+    app_name: str = "fastapi-service"
+    app_version: str = "1.0.0"
+    environment: str = "production"
+    debug_mode: bool = Field(False, validation_alias="DEBUG")
 
-        # 캐시 설정
-        self.cache_ttl: int = int(os.getenv("CACHE_TTL", "60"))
-        self.cache_max_size: int = int(os.getenv("CACHE_MAX_SIZE", "1000"))
+    # 데이터베이스 설정
+    db_host: str = "localhost"
+    db_port: int = 5432
+    db_name: str = "app_db"
+    db_user: str = "postgres"
+    db_password: Optional[str] = None
+
+    # PgBouncer(transaction 모드) 경유 여부
+    db_pgbouncer: bool = False
+
+    # 커넥션 풀 설정 (기본값은 _pool_defaults에서 결정)
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_recycle: int = 280
+    db_pool_timeout: int = 10
+
+    # Redis 설정
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+
+    # 캐시 설정
+    cache_ttl: int = 60
+    cache_max_size: int = 1000
+
+    # 로깅 설정
+    # 요청 시작/정상 완료 로그를 DEBUG로 낮출 경로 (LB 헬스 체크 등 자주 호출되는 가벼운 경로)
+    log_quiet_paths: FrozenSet[str] = frozenset({"/", "/health"})
+
+    # 인증 설정
+    bcrypt_cost: int = 12
+
+    # 외부 API 설정
+    external_api_url: str = "https://api.example.com"
+
+    # SMTP 설정 (smtp_host가 없으면 메일을 실제로 보내지 않고 로그만 남김)
+    smtp_host: Optional[str] = None
+    smtp_port: int = 587
+    smtp_user: Optional[str] = None
+    smtp_password: Optional[str] = None
+    smtp_from: str = "noreply@example.com"
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pool_defaults(cls, data: Any) -> Any:
+        """
+        커넥션 풀 기본값
+        직접 연결: HikariCP 공식 cpu_count * 2 + 1
+        PgBouncer 경유: 서버 연결은 PgBouncer가 관리하므로 워커당 작은 풀만 유지
+        """
+        if isinstance(data, dict):
+            pgbouncer = str(data.get("db_pgbouncer", "false")).lower() in ("true", "1", "yes", "on")
+            data.setdefault("db_pool_size", 5 if pgbouncer else (os.cpu_count() or 1) * 2 + 1)
+            data.setdefault("db_max_overflow", 5 if pgbouncer else 10)
+        return data
+
+    @cached_property
+    def db_url(self) -> str:
+        """데이터베이스 연결 URL (설정이 불변이므로 한 번만 생성)"""
+        return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
     def get_db_url(self) -> str:
         """데이터베이스 연결 URL 생성"""
-        return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        return self.db_url
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 인스턴스 (최초 1회만 생성, FastAPI Depends로 주입 가능)"""
+    return Settings()
 
 
 # 전역 설정 인스턴스
-settings = Settings()
+settings = get_settings()
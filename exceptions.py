@@ -2,13 +2,34 @@
 커스텀 예외 클래스 및 글로벌 예외 핸들러
 """
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from typing import Dict, Tuple
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# 고정 메시지 에러 응답은 import 시 한 번만 직렬화
+_GENERIC_500_BODY = orjson.dumps(
+    {
+        "error": {
+            "code": "INTERNAL_ERROR",
+            "message": "서버 내부 오류가 발생했습니다",
+        }
+    }
+)
+
+# HTTPException 응답 본문 캐시: (상태 코드, detail 문자열) -> 직렬화된 본문
+# 상수 detail은 한 번만 직렬화하고, 요청값이 섞인 detail로 무한히 커지지 않도록 상한을 둠
+HTTP_EXCEPTION_BODY_CACHE_SIZE = 256
+_HTTP_EXCEPTION_BODIES: Dict[Tuple[int, str], bytes] = {}
+
+# 본문을 보낼 수 없는 상태 코드 (FastAPI 기본 핸들러와 동일한 처리)
+_NO_BODY_STATUS_CODES = frozenset({204, 304})
+
 
 class BaseAPIException(Exception):
     """기본 API 예외 클래스"""
@@ -114,15 +135,48 @@ async def base_exception_handler(request: Request, exc: BaseAPIException):
         },
     )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": {
-                "code": exc.error_code,
-                "message": exc.message,
-                "path": str(request.url.path),
+    return Response(
+        content=orjson.dumps(
+            {
+                "error": {
+                    "code": exc.error_code,
+                    "message": exc.message,
+                    "path": request.url.path,
+                }
             }
-        },
+        ),
+        status_code=exc.status_code,
+        media_type="application/json",
+    )
+
+
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """
+    HTTPException 핸들러
+    FastAPI 기본 핸들러와 같은 {"detail": ...} 응답을 만들되,
+    문자열 detail은 (상태 코드, detail)별로 직렬화 결과를 재사용합니다.
+    """
+    status_code = exc.status_code
+    headers = exc.headers
+    if status_code < 200 or status_code in _NO_BODY_STATUS_CODES:
+        return Response(status_code=status_code, headers=headers)
+
+    detail = exc.detail
+    if isinstance(detail, str):
+        key = (status_code, detail)
+        body = _HTTP_EXCEPTION_BODIES.get(key)
+        if body is None:
+            body = orjson.dumps({"detail": detail})
+            if len(_HTTP_EXCEPTION_BODIES) < HTTP_EXCEPTION_BODY_CACHE_SIZE:
+                _HTTP_EXCEPTION_BODIES[key] = body
+    else:
+        body = orjson.dumps({"detail": detail})
+
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
     )
 
 
@@ -143,15 +197,18 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         extra={"path": request.url.path, "method": request.method},
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": {
-                "code": "VALIDATION_ERROR",
-                "message": "입력 데이터 검증에 실패했습니다",
-                "details": errors,
+    return Response(
+        content=orjson.dumps(
+            {
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": "입력 데이터 검증에 실패했습니다",
+                    "details": errors,
+                }
             }
-        },
+        ),
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        media_type="application/json",
     )
 
 
@@ -162,12 +219,8 @@ async def general_exception_handler(request: Request, exc: Exception):
         extra={"path": request.url.path, "method": request.method},
     )
 
-    return JSONResponse(
+    return Response(
+        content=_GENERIC_500_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "서버 내부 오류가 발생했습니다",
-            }
-        },
+        media_type="application/json",
     )
@@ -1,86 +1,142 @@
 """
 Health check utilities for monitoring service status
 """
+import asyncio
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import aiohttp
+import redis.asyncio as aioredis
+from sqlalchemy import text
+from config import settings
+from database import async_engine
 from logger_config import get_logger
 
+__all__ = ["HealthChecker", "create_http_session"]
+
 logger = get_logger(__name__)
 
+# Upper bound for a single component check
+CHECK_TIMEOUT_SECONDS = 2.0
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """
+    Create the shared outbound HTTP session
+
+    Connections are pooled and kept alive so repeated calls skip the
+    TCP/TLS handshake. Must be called from within the running event loop.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        keepalive_timeout=30,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=5, connect=2),
+    )
+
 
 class HealthChecker:
     """Utility class for performing health checks on various components"""
 
-    def __init__(self):
+    __slots__ = ("start_time", "redis_client", "http_session")
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        http_session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.start_time = time.time()
+        self.redis_client = redis_client
+        # 앱 시작 시 생성되는 공유 세션 (keep-alive 연결 재사용)
+        self.http_session = http_session
 
     def get_uptime(self) -> float:
         """Get service uptime in seconds"""
         return time.time() - self.start_time
 
+    @staticmethod
+    async def _ping_database() -> None:
+        """Run SELECT 1 on a pooled connection"""
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
     async def check_database(self) -> Dict[str, Any]:
         """Check database connectivity"""
         try:
-            # Simulate DB health check
-            check_start = time.time()
-            time.sleep(0.01)  # Simulate ping
-            latency_ms = (time.time() - check_start) * 1000
+            check_start = time.perf_counter()
+            await asyncio.wait_for(self._ping_database(), CHECK_TIMEOUT_SECONDS)
+            latency_ms = (time.perf_counter() - check_start) * 1000
 
+            pool = async_engine.pool
             return {
                 "status": "healthy",
                 "latency_ms": round(latency_ms, 2),
                 "connection_pool": {
-                    "active": 2,
-                    "idle": 8,
-                    "max": 10
+                    "active": pool.checkedout(),
+                    "idle": pool.checkedin(),
+                    "max": pool.size()
                 }
             }
         except Exception as exc:
+            error_message = str(exc)
             logger.error(
                 "health_check_failed",
                 message="Database health check failed",
-                error={"type": type(exc).__name__, "message": str(exc)},
+                error={"type": type(exc).__name__, "message": error_message},
                 exc_info=True
             )
             return {
                 "status": "unhealthy",
-                "error": str(exc)
+                "error": error_message
             }
 
     async def check_redis(self) -> Dict[str, Any]:
         """Check Redis connectivity"""
+        if self.redis_client is None:
+            return {"status": "unhealthy", "error": "Redis client not configured"}
+
         try:
-            # Simulate Redis health check
-            check_start = time.time()
-            time.sleep(0.005)  # Simulate ping
-            latency_ms = (time.time() - check_start) * 1000
+            check_start = time.perf_counter()
+            await asyncio.wait_for(self.redis_client.ping(), CHECK_TIMEOUT_SECONDS)
+            latency_ms = (time.perf_counter() - check_start) * 1000
 
+            memory = await asyncio.wait_for(
+                self.redis_client.info("memory"), CHECK_TIMEOUT_SECONDS
+            )
             return {
                 "status": "healthy",
                 "latency_ms": round(latency_ms, 2),
-                "memory_used_mb": 45.2,
-                "memory_peak_mb": 52.1
+                "memory_used_mb": round(memory.get("used_memory", 0) / (1024 * 1024), 2),
+                "memory_peak_mb": round(memory.get("used_memory_peak", 0) / (1024 * 1024), 2)
             }
         except Exception as exc:
+            error_message = str(exc)
             logger.error(
                 "health_check_failed",
                 message="Redis health check failed",
-                error={"type": type(exc).__name__, "message": str(exc)},
+                error={"type": type(exc).__name__, "message": error_message},
                 exc_info=True
             )
             return {
                 "status": "unhealthy",
-                "error": str(exc)
+                "error": error_message
             }
 
     async def get_full_status(self) -> Dict[str, Any]:
         """Get comprehensive health status"""
-        db_health = await self.check_database()
-        redis_health = await self.check_redis()
+        db_health, redis_health, external_api_health = await asyncio.gather(
+            self.check_database(),
+            self.check_redis(),
+            self.check_external_api(),
+        )
 
         overall_healthy = (
             db_health.get("status") == "healthy" and
-            redis_health.get("status") == "healthy"
+            redis_health.get("status") == "healthy" and
+            external_api_health.get("status") == "healthy"
         )
 
         return {
@@ -90,30 +146,49 @@ class HealthChecker:
             "service_name": "fastapi-service",
             "components": {
                 "database": db_health,
-                "redis": redis_health
+                "redis": redis_health,
+                "external_api": external_api_health
             }
         }
 
-    async def check_external_api(self) -> Dict[str, Any]:
+    @staticmethod
+    async def _get_status(session: aiohttp.ClientSession, endpoint: str) -> int:
+        """Send GET to the endpoint and return the response status"""
+        async with session.get(endpoint) as response:
+            return response.status
+
+    async def check_external_api(
+        self, session: Optional[aiohttp.ClientSession] = None
+    ) -> Dict[str, Any]:
         """외부 API 연결 상태 확인"""
+        session = session or self.http_session
+        endpoint = settings.external_api_url
+        if session is None:
+            return {"status": "unhealthy", "error": "HTTP session not configured"}
+
         try:
-            check_start = time.time()
-            time.sleep(0.02)  # 외부 API 호출 시뮬레이션
-            latency_ms = (time.time() - check_start) * 1000
+            check_start = time.perf_counter()
+            # DB/Redis 체크와 같은 예산으로 제한 (세션 total 타임아웃보다 짧게)
+            status_code = await asyncio.wait_for(
+                self._get_status(session, endpoint), CHECK_TIMEOUT_SECONDS
+            )
+            latency_ms = (time.perf_counter() - check_start) * 1000
 
             return {
-                "status": "healthy",
+                "status": "healthy" if status_code < 500 else "unhealthy",
                 "latency_ms": round(latency_ms, 2),
-                "endpoint": "https://api.example.com"
+                "status_code": status_code,
+                "endpoint": endpoint
             }
         except Exception as exc:
+            error_message = str(exc)
             logger.error(
                 "external_api_check_failed",
                 message="External API health check failed",
-                error={"type": type(exc).__name__, "message": str(exc)},
+                error={"type": type(exc).__name__, "message": error_message},
                 exc_info=True
             )
             return {
                 "status": "unhealthy",
-                "error": str(exc)
+                "error": error_message
             }
@@ -4,17 +4,55 @@ FastAPI용 structlog 기반 로거 설정
 """
 
 import structlog
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 import traceback
-from datetime import datetime, timezone
+import time
+from datetime import timedelta, timezone
 import socket
 import os
-from typing import Any
-import pytz
+from contextvars import ContextVar, Token
+from types import CodeType
+from typing import Any, Optional
+import orjson
 
-# 한국 시간대 설정
-KST = pytz.timezone('Asia/Seoul')
+# 한국 시간대 설정 (서머타임이 없으므로 고정 오프셋으로 충분)
+KST = timezone(timedelta(hours=9))
+_KST_OFFSET_SECONDS = 9 * 60 * 60
+
+# 프로세스 수명 동안 변하지 않는 공통 필드는 로그마다 조회하지 않도록 한 번만 계산
+_SERVICE = os.getenv("SERVICE_NAME", "fastapi-service")
+_ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+_HOST = socket.gethostname()
+
+# 최소 로그 레벨 (이보다 낮은 레벨의 호출은 structlog에서 바로 무시됨)
+LOG_LEVEL = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+if not isinstance(LOG_LEVEL, int):
+    LOG_LEVEL = logging.INFO
+
+
+# 마지막으로 포맷한 초와 그 "YYYY-MM-DDTHH:MM:SS" 문자열
+_ts_cache = (None, "")
+
+
+def _kst_timestamp(now: Optional[float] = None) -> str:
+    """
+    주어진 epoch 시각(기본값: 현재)을 ISO 8601 KST 형식 문자열로 반환합니다.
+    초 단위 부분은 같은 초 안에서 재사용하고 마이크로초만 새로 붙입니다.
+    """
+    global _ts_cache
+    if now is None:
+        now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec + _KST_OFFSET_SECONDS))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((now - sec) * 1_000_000):06d}+09:00"
 
 
 def add_common_fields(logger: Any, method_name: str, event_dict: dict) -> dict:
@@ -22,14 +60,13 @@ def add_common_fields(logger: Any, method_name: str, event_dict: dict) -> dict:
     모든 로그에 공통 필드를 추가하는 프로세서
     """
     # 공통 필드 추가
-    event_dict["service"] = os.getenv("SERVICE_NAME", "fastapi-service")
-    event_dict["environment"] = os.getenv("ENVIRONMENT", "development")
-    event_dict["host"] = socket.gethostname()
+    event_dict["service"] = _SERVICE
+    event_dict["environment"] = _ENVIRONMENT
+    event_dict["host"] = _HOST
 
     # timestamp를 ISO 8601 KST 형식으로 변환 (한국 시간)
     if "timestamp" not in event_dict:
-        kst_time = datetime.now(KST)
-        event_dict["timestamp"] = kst_time.isoformat()
+        event_dict["timestamp"] = _kst_timestamp()
 
     # level을 대문자로 통일
     if "level" in event_dict:
@@ -38,14 +75,44 @@ def add_common_fields(logger: Any, method_name: str, event_dict: dict) -> dict:
     return event_dict
 
 
+# 요청 단위 로그 컨텍스트 (trace_id 등)
+# 키마다 ContextVar를 set/reset하는 bind_contextvars 대신 요청당 dict 하나를 한 번만 set
+_REQUEST_CONTEXT: ContextVar[Optional[dict]] = ContextVar("request_log_context", default=None)
+
+
+def bind_request_context(**values: Any) -> Token:
+    """
+    현재 요청의 로그 컨텍스트를 설정합니다.
+    반환된 토큰을 reset_request_context에 넘겨 요청 종료 시 이전 상태로 되돌립니다.
+    """
+    return _REQUEST_CONTEXT.set(values)
+
+
+def reset_request_context(token: Token) -> None:
+    """bind_request_context로 설정한 로그 컨텍스트를 해제합니다."""
+    _REQUEST_CONTEXT.reset(token)
+
+
+def merge_request_context(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """
+    요청 로그 컨텍스트를 이벤트에 병합하는 프로세서
+    (로그 호출 시 직접 넘긴 키가 우선)
+    """
+    ctx = _REQUEST_CONTEXT.get()
+    if ctx:
+        for key, value in ctx.items():
+            event_dict.setdefault(key, value)
+    return event_dict
+
+
 def add_trace_context(logger: Any, method_name: str, event_dict: dict) -> dict:
     """
     분산 추적 컨텍스트를 추가하는 프로세서
     실제 환경에서는 OpenTelemetry 등과 연동
     """
     # 컨텍스트에서 trace_id, span_id 추출 (있는 경우)
-    if hasattr(structlog.contextvars, "get_contextvars"):
-        ctx = structlog.contextvars.get_contextvars()
+    ctx = _REQUEST_CONTEXT.get()
+    if ctx:
         if "trace_id" in ctx:
             event_dict["trace_id"] = ctx["trace_id"]
         if "span_id" in ctx:
@@ -54,60 +121,258 @@ def add_trace_context(logger: Any, method_name: str, event_dict: dict) -> dict:
     return event_dict
 
 
+# 프로젝트 파일이 아닌 것으로 판단할 경로 조각
+_SKIP_MARKERS = ("site-packages", "/lib/", "\\lib\\")
+# 프로젝트 루트 디렉토리 (상대 경로 변환 기준)
+_PROJECT_MARKERS = ("/app/", "\\app\\")
+
+# 코드 객체별 (상대 경로, 함수명) 또는 None(프로젝트 외부) 캐시
+_LOCATION_CACHE_MAX = 1024
+_location_cache: dict = {}
+
+
+def _code_location(code: CodeType):
+    """
+    코드 객체가 프로젝트 파일에 속하면 (상대 경로, 함수명)을, 아니면 None을 반환합니다.
+    코드 객체는 불변이므로 결과를 캐싱합니다.
+    """
+    try:
+        return _location_cache[code]
+    except KeyError:
+        pass
+
+    filename = code.co_filename
+    if any(marker in filename for marker in _SKIP_MARKERS):
+        location = None
+    else:
+        # 프로젝트 루트 기준 상대 경로로 변환
+        for marker in _PROJECT_MARKERS:
+            if marker in filename:
+                relative_path = filename.rsplit(marker, 1)[-1]
+                break
+        else:
+            relative_path = os.path.basename(filename)
+        location = (relative_path, code.co_name)
+
+    if len(_location_cache) >= _LOCATION_CACHE_MAX:
+        _location_cache.clear()
+    _location_cache[code] = location
+    return location
+
+
 def add_error_location(logger: Any, method_name: str, event_dict: dict) -> dict:
     """
     에러 발생 시 파일 위치 정보 및 스택 트레이스를 추가하는 프로세서
     """
-    # exc_info가 있는 경우 (에러 로그)
+    # exc_info가 없는 경우 (대부분의 로그) 바로 반환
     exc_info = event_dict.get("exc_info")
-    if exc_info:
-        # exc_info가 True인 경우 현재 예외 정보 가져오기
-        if exc_info is True:
-            import sys
-            exc_info = sys.exc_info()
-
-        # 튜플인지 확인
-        if isinstance(exc_info, tuple) and len(exc_info) == 3:
-            exc_type, exc_value, exc_tb = exc_info
-
-            if exc_tb:
-                # error 필드 초기화
-                if "error" not in event_dict:
-                    event_dict["error"] = {}
-
-                # 전체 스택 트레이스를 문자열로 변환
-                tb_lines = traceback.format_exception(exc_type, exc_value, exc_tb)
-                full_traceback = "".join(tb_lines)
-                event_dict["error"]["stack_trace"] = full_traceback
-
-                # 스택 트레이스에서 프로젝트 파일 찾기 (site-packages 제외)
-                tb = exc_tb
-                while tb is not None:
-                    frame = tb.tb_frame
-                    filename = frame.f_code.co_filename
-
-                    # 프로젝트 파일인지 확인 (site-packages, lib 제외)
-                    if "site-packages" not in filename and "/lib/" not in filename and "\\lib\\" not in filename:
-                        # 프로젝트 루트 기준 상대 경로로 변환
-                        if "/app/" in filename:
-                            relative_path = filename.split("/app/")[-1]
-                        elif "\\app\\" in filename:
-                            relative_path = filename.split("\\app\\")[-1]
-                        else:
-                            relative_path = os.path.basename(filename)
-
-                        event_dict["error"]["location"] = {
-                            "file": relative_path,
-                            "line": tb.tb_lineno,
-                            "function": frame.f_code.co_name
-                        }
-                        break
-
-                    tb = tb.tb_next
+    if not exc_info:
+        return event_dict
+
+    # exc_info가 True인 경우 현재 예외 정보 가져오기
+    if exc_info is True:
+        exc_info = sys.exc_info()
+
+    # 튜플인지 확인
+    if not (isinstance(exc_info, tuple) and len(exc_info) == 3):
+        return event_dict
+
+    exc_type, exc_value, exc_tb = exc_info
+    if not exc_tb:
+        return event_dict
+
+    # error 필드 초기화
+    if "error" not in event_dict:
+        event_dict["error"] = {}
+
+    # 전체 스택 트레이스를 문자열로 변환
+    tb_lines = traceback.format_exception(exc_type, exc_value, exc_tb)
+    full_traceback = "".join(tb_lines)
+    event_dict["error"]["stack_trace"] = full_traceback
+
+    # 스택 트레이스에서 가장 안쪽 프로젝트 프레임 찾기 (site-packages/표준 라이브러리 제외)
+    # 예외를 호출한 쪽이 아니라 실제로 실패한 문장의 위치를 기록함
+    found = None
+    tb = exc_tb
+    while tb is not None:
+        location = _code_location(tb.tb_frame.f_code)
+        if location is not None:
+            found = (location, tb.tb_lineno)
+        tb = tb.tb_next
+
+    if found is not None:
+        (relative_path, function), line = found
+        event_dict["error"]["location"] = {
+            "file": relative_path,
+            "line": line,
+            "function": function
+        }
 
     return event_dict
 
 
+# LazyStr 값 생성용 락: 요청 스레드와 큐 리스너 스레드가 같은 값을 동시에 렌더링해도
+# 팩토리는 한 번만 실행됨 (생성 후에는 락 없이 캐시된 값을 반환)
+_LAZY_STR_LOCK = threading.Lock()
+
+
+class LazyStr:
+    """
+    실제로 렌더링될 때 처음 한 번만 값을 생성하는 문자열 대용 객체
+    (로그에 찍히지 않는 요청 ID 등의 생성 비용을 피하기 위함)
+    """
+
+    __slots__ = ("_value", "_factory")
+
+    def __init__(self, factory):
+        self._value = None
+        self._factory = factory
+
+    def __str__(self) -> str:
+        value = self._value
+        if value is None:
+            with _LAZY_STR_LOCK:
+                value = self._value
+                if value is None:
+                    value = self._value = self._factory()
+        return value
+
+    __repr__ = __str__
+
+
+def _orjson_default(value: Any) -> Any:
+    """orjson이 직접 처리하지 못하는 값 변환 (LazyStr는 실제 값, 나머지는 repr)"""
+    if isinstance(value, LazyStr):
+        return str(value)
+    return repr(value)
+
+
+# 레코드마다 옵션을 조합하지 않도록 미리 계산
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    structlog JSONRenderer용 orjson 직렬화 함수 (stdlib 핸들러를 위해 str 반환)
+    JSONRenderer가 넘기는 default는 무시하고 모듈 수준 변환 함수를 재사용해
+    레코드마다 클로저를 만들지 않는다.
+    """
+    return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS).decode()
+
+
+def add_record_timestamp(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """
+    stdlib 로거 레코드의 생성 시각으로 timestamp를 추가하는 프로세서
+    (포맷이 리스너 스레드에서 늦게 일어나도 로그 호출 시각을 유지)
+    """
+    record = event_dict.get("_record")
+    if record is not None and "timestamp" not in event_dict:
+        event_dict["timestamp"] = _kst_timestamp(record.created)
+    return event_dict
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러 (포맷은 리스너 스레드에서 수행)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchFlushMixin:
+    """
+    레코드마다 flush(write 시스템 콜)하지 않고 스트림 버퍼에 모았다가
+    flush_batch() 호출 시 한 번에 내보내는 핸들러 믹스인
+    """
+
+    _defer_flush = True
+
+    def flush(self):
+        # StreamHandler.emit이 레코드마다 호출하는 flush는 건너뜀
+        if not self._defer_flush:
+            super().flush()
+
+    def flush_batch(self):
+        """버퍼에 모인 로그를 실제로 내보냄"""
+        with self.lock:
+            self._defer_flush = False
+            try:
+                self.flush()
+            finally:
+                self._defer_flush = True
+
+
+class BatchedStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    """배치 flush StreamHandler"""
+
+
+class BatchedTimedRotatingFileHandler(_BatchFlushMixin, logging.handlers.TimedRotatingFileHandler):
+    """배치 flush TimedRotatingFileHandler"""
+
+
+class _RenderingQueueListener(logging.handlers.QueueListener):
+    """
+    레코드를 한 번만 렌더링한 뒤 모든 핸들러에 전달하는 리스너
+    큐가 비는 시점(부하가 없을 때는 매 레코드, 부하 중에는 묶음 단위)에 핸들러를 flush하고,
+    큐가 계속 차 있어도 버퍼가 flush_bytes를 넘거나 첫 레코드가 flush_interval초 이상
+    기다리면 flush해 버퍼 크기와 출력 지연에 상한을 둔다.
+    """
+
+    flush_bytes = 64 * 1024
+    flush_interval = 0.05
+
+    def __init__(self, log_queue, *handlers, formatter: logging.Formatter, **kwargs):
+        super().__init__(log_queue, *handlers, **kwargs)
+        self.formatter = formatter
+        # 마지막 flush 이후 버퍼에 쌓인 크기와 첫 레코드 시각 (리스너 스레드에서만 접근)
+        self._pending_bytes = 0
+        self._pending_since: Optional[float] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = self.formatter.format(record)
+        record.msg = message
+        record.message = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        self._pending_bytes += len(record.msg)
+        if (
+            self.queue.empty()
+            or self._pending_bytes >= self.flush_bytes
+            or now - self._pending_since >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """배치 핸들러의 버퍼를 내보냄"""
+        self._pending_bytes = 0
+        self._pending_since = None
+        for handler in self.handlers:
+            if isinstance(handler, _BatchFlushMixin):
+                handler.flush_batch()
+
+    @property
+    def running(self) -> bool:
+        """리스너 스레드 실행 여부"""
+        return self._thread is not None
+
+    def stop(self) -> None:
+        super().stop()
+        self.flush()
+
+
+# 실제 출력 핸들러를 소유하는 백그라운드 리스너
+# (setup_logging에서 생성만 하고, 스레드는 start_log_listener에서 시작)
+log_listener = None
+
+
 def setup_logging():
     """
     structlog 설정 초기화
@@ -122,15 +387,13 @@ def setup_logging():
         os.makedirs(log_path, exist_ok=True)
 
     # 파일 핸들러 추가 with daily rotation support
-    from logging.handlers import TimedRotatingFileHandler
-
     # 날짜별 파일명 생성을 위한 커스텀 네이머
     def namer(default_name):
         # app.log.2025-10-26 -> app-2025-10-26.log 형식으로 변경
         base_filename, ext, date = default_name.rsplit('.', 2)
         return f"{base_filename}-{date}.log"
 
-    file_handler = TimedRotatingFileHandler(
+    file_handler = BatchedTimedRotatingFileHandler(
         f"{log_path}/app.log",
         when='midnight',  # 매일 자정에 로테이션
         interval=1,       # 1일 간격
@@ -139,23 +402,51 @@ def setup_logging():
     )
     file_handler.suffix = "%Y-%m-%d"
     file_handler.namer = namer
-    file_handler.setLevel(logging.INFO)
+    file_handler.setLevel(LOG_LEVEL)
+
+    # JSON 렌더링은 리스너 스레드에서 레코드당 한 번 수행
+    # (stdlib 로거의 레코드도 foreign_pre_chain을 거쳐 같은 JSON 포맷으로 출력)
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            # JSON 형식으로 렌더링 (orjson)
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ],
+        foreign_pre_chain=[
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.ExtraAdder(),
+            add_record_timestamp,
+            add_common_fields,
+            add_error_location,
+            structlog.processors.format_exc_info,
+        ],
+    )
+
+    # 요청 스레드는 큐에 레코드만 넣고, 렌더링과 디스크/stdout 쓰기는 리스너 스레드가 수행
+    global log_listener
+    log_queue = queue.SimpleQueue()
+    log_listener = _RenderingQueueListener(
+        log_queue,
+        BatchedStreamHandler(sys.stdout),
+        file_handler,
+        formatter=formatter,
+        respect_handler_level=True,
+    )
+    # import 시에는 스레드를 만들지 않음: 프리로드 후 fork하는 서버에서도
+    # 각 워커가 lifespan에서 자기 리스너를 시작하도록 함
+    atexit.register(_drain_log_queue)
 
     # 기본 logging 설정
     logging.basicConfig(
-        format="%(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            file_handler
-        ],
-        level=logging.INFO,
+        handlers=[_DeferredQueueHandler(log_queue)],
+        level=LOG_LEVEL,
     )
 
     # structlog 설정
     structlog.configure(
         processors=[
-            # 컨텍스트 변수 병합
-            structlog.contextvars.merge_contextvars,
+            # 요청 컨텍스트(trace_id 등) 병합
+            merge_request_context,
             # 로그 레벨 추가
             structlog.stdlib.add_log_level,
             # 타임스탬프는 add_common_fields에서 KST로 추가하므로 여기서는 제외
@@ -167,16 +458,57 @@ def setup_logging():
             add_error_location,
             # 예외 정보 포맷팅
             structlog.processors.format_exc_info,
-            # JSON 형식으로 렌더링
-            structlog.processors.JSONRenderer(),
+            # 렌더링은 리스너 스레드의 ProcessorFormatter에 위임
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # LOG_LEVEL 미만의 호출은 프로세서 체인을 타지 않는 no-op 메서드로 처리
+        wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def start_log_listener() -> None:
+    """로그 리스너 스레드 시작 (FastAPI lifespan 시작 시 호출, 이미 실행 중이면 무시)"""
+    if log_listener is not None and not log_listener.running:
+        log_listener.start()
+
+
+def stop_log_listener() -> None:
+    """큐에 남은 로그를 모두 내보내고 리스너 스레드 종료 (lifespan 종료 시 호출)"""
+    if log_listener is not None and log_listener.running:
+        log_listener.stop()
+
+
+def _drain_log_queue() -> None:
+    """
+    프로세스 종료 시 리스너가 돌고 있지 않으면 (lifespan 밖에서 쓰인 경우 등)
+    큐에 남은 로그를 한 번 처리하고 종료
+    """
+    if log_listener is None:
+        return
+    if not log_listener.running:
+        if log_listener.queue.empty():
+            return
+        log_listener.start()
+    log_listener.stop()
+
+
+def flush_logs() -> None:
+    """아직 내보내지 않은 로그 버퍼를 flush합니다 (종료 시 호출)."""
+    if log_listener is not None:
+        log_listener.flush()
+
+
+def is_enabled_for(level: int) -> bool:
+    """
+    해당 레벨의 로그가 출력되는지 확인합니다.
+    로그 인자(dict 등) 생성 비용이 큰 경우 호출 전에 확인하는 용도입니다.
+    """
+    return level >= LOG_LEVEL
+
+
 def get_logger(name: str = None):
     """
     로거 인스턴스를 가져옵니다.
@@ -186,8 +518,12 @@ def get_logger(name: str = None):
 
     Returns:
         structlog 로거 인스턴스
+
+    setup_logging()이 모듈 import 시 이미 실행되므로 lazy proxy 대신 바로 bind()한
+    로거를 반환합니다. proxy는 로그 호출마다 __getattr__와 bind()를 거치지만,
+    bind된 로거는 메서드를 바로 호출합니다.
     """
-    return structlog.get_logger(name)
+    return structlog.get_logger(name).bind()
 
 
 # 로거 초기화
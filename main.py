@@ -4,15 +4,33 @@ FastAPI 예시 애플리케이션
 """
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import asyncio
+import json
+import logging
+import os
+import threading
 import time
-import uuid
 from contextlib import asynccontextmanager
-import structlog
-
-from logger_config import get_logger
-from health_check import HealthChecker
-from cache_utils import SimpleCache
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Type
+import orjson
+
+from config import settings
+from logger_config import (
+    LazyStr,
+    bind_request_context,
+    flush_logs,
+    get_logger,
+    is_enabled_for,
+    reset_request_context,
+    start_log_listener,
+    stop_log_listener,
+)
+from auth import token_cache
+from exceptions import StarletteHTTPException, http_exception_handler
+from health_check import HealthChecker, create_http_session
+from cache_utils import RedisCache
 from test_errors import router as test_errors_router
 
 
@@ -23,19 +41,128 @@ logger = get_logger(__name__)
 # This simulates a database connection error at a specific line
 # undefined_database_connection_variable  # 주석 처리하여 앱 정상 시작
 
-# Health checker instance
-health_checker = HealthChecker()
+# 요청 ID용 난수 풀: os.urandom을 ID마다 호출하는 대신 UUID 64개 분량씩 미리 받아둠
+_ID_BATCH = 64
+_id_pool = threading.local()
+
+
+def _pooled_random_bytes(n: int) -> bytearray:
+    """스레드별 난수 풀에서 n바이트를 꺼냄 (부족하면 새로 채움)"""
+    buf = getattr(_id_pool, "buf", None)
+    offset = getattr(_id_pool, "offset", 0)
+    if buf is None or offset + n > len(buf):
+        buf = bytearray(os.urandom(16 * _ID_BATCH))
+        offset = 0
+        _id_pool.buf = buf
+    _id_pool.offset = offset + n
+    return buf[offset:offset + n]
+
+
+def _fast_uuid4() -> str:
+    """UUID 객체를 만들지 않고 UUID v4 형식 문자열을 생성"""
+    b = _pooled_random_bytes(16)
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _fast_request_id() -> str:
+    """
+    요청 ID 생성 (96비트 난수, 24자리 hex)
+    로그 키로만 쓰이므로 UUID 형식이 필요 없음
+    (trace_id/span_id는 외부 추적 시스템과의 호환을 위해 UUID 형식 유지)
+    """
+    return _pooled_random_bytes(12).hex()
+
+
+# trace 컨텍스트를 바인딩하지 않는 경로 (LB 헬스 체크 등 추적이 필요 없는 요청)
+_UNTRACED_PATHS = frozenset({"/health"})
+
+# 요청 시작/정상 완료 로그를 DEBUG로 낮출 경로
+# 로그 레벨은 실행 중 바뀌지 않으므로 DEBUG 여부를 미리 계산해
+# 꺼져 있으면 로그 인자(dict)도 만들지 않는다.
+_QUIET_PATHS = settings.log_quiet_paths
+_DEBUG_ENABLED = is_enabled_for(logging.DEBUG)
+
+
+# 엔드포인트 로그의 고정 필드는 import 시 한 번만 생성 (요청마다 duration_ms만 추가)
+_GET_USER_QUERY = {
+    "type": "SELECT",
+    "statement": "SELECT * FROM users WHERE id = ?",
+    "rows_affected": 1,
+    "database": "user_db"
+}
+_CREATE_USER_QUERY = {
+    "type": "INSERT",
+    "statement": "INSERT INTO users (name, email) VALUES (?, ?)",
+    "rows_affected": 1,
+    "database": "user_db"
+}
+_SLOW_QUERY = {
+    "type": "SELECT",
+    "statement": "SELECT * FROM large_table WHERE complex_condition = ? -- optimized with index",
+    "rows_affected": 1000,
+    "database": "analytics_db"
+}
+_SLOW_QUERY_CONTEXT = {
+    "threshold_ms": 1000,
+    "warning": "Query exceeded performance threshold"
+}
+_TRIGGER_ERROR_CONTEXT = {
+    "operation": "divide",
+    "endpoint": "/error"
+}
+_REQUIRED_USER_FIELDS = ("name", "email")
+
 
 # Cache instance
-user_cache = SimpleCache(default_ttl=60)  # 1 minute TTL
+user_cache = RedisCache(default_ttl=60)  # 1 minute TTL, shared across workers
+
+# Health checker instance (Redis 연결 풀은 캐시와 공유)
+health_checker = HealthChecker(redis_client=user_cache.client)
+
+# LB가 초당 여러 번 호출해도 실제 점검은 TTL마다 한 번만 수행
+HEALTH_CACHE_TTL_SECONDS = 1.0
+
+
+class _HealthSnapshot:
+    """마지막 헬스 체크 결과 (미리 인코딩한 응답 본문)"""
+
+    __slots__ = ("checked_at", "body")
+
+    def __init__(self):
+        self.checked_at = float("-inf")
+        self.body: Optional[bytes] = None
+
+
+_health_snapshot = _HealthSnapshot()
+_health_refresh_lock = asyncio.Lock()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행"""
+    # 로그 렌더링/출력 스레드는 워커 프로세스 안에서 시작 (import 시 시작하지 않음)
+    start_log_listener()
     logger.info("application_started", message="FastAPI application started")
+    # 모든 외부 HTTP 호출이 공유하는 세션
+    app.state.http = create_http_session()
+    health_checker.http_session = app.state.http
+    # 만료 캐시 항목 정리는 요청 경로 밖의 백그라운드 태스크에서 수행
+    app.state.cache_tasks = [
+        asyncio.create_task(user_cache.run_janitor()),
+        asyncio.create_task(token_cache.run_janitor()),
+    ]
     yield
+    for task in app.state.cache_tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.cache_tasks, return_exceptions=True)
+    await app.state.http.close()
+    await user_cache.close()
     logger.info("application_shutdown", message="FastAPI application shutdown")
+    flush_logs()
+    stop_log_listener()
 
 
 app = FastAPI(
@@ -43,10 +170,15 @@ app = FastAPI(
     description="통합 로그 포맷을 사용하는 예시 애플리케이션 with 테스트 에러 API",
     version="1.0.0",
     lifespan=lifespan,
+    # dict 응답을 stdlib json 대신 orjson으로 직렬화
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
+# HTTPException 응답은 상수 detail 본문을 캐시해 재사용하는 핸들러로 처리
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+
 # 테스트 에러 라우터 추가
 app.include_router(test_errors_router)
 
@@ -56,103 +188,131 @@ async def logging_middleware(request: Request, call_next):
     """
     HTTP 요청/응답 로깅 미들웨어
     """
-    # 요청별 고유 ID 생성
-    request_id = str(uuid.uuid4())
-    trace_id = request.headers.get("X-Trace-Id", str(uuid.uuid4()))
-    span_id = str(uuid.uuid4())
+    # 요청 속성은 한 번만 조회해 재사용
+    method = request.method
+    path = request.url.path
+    client_ip = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
 
+    # 요청별 고유 ID (로그가 실제로 렌더링될 때만 생성)
     # 컨텍스트에 trace 정보 바인딩
-    structlog.contextvars.bind_contextvars(
-        trace_id=trace_id,
-        span_id=span_id,
-        request_id=request_id
-    )
+    context_token = None
+    if path not in _UNTRACED_PATHS:
+        context_token = bind_request_context(
+            trace_id=request.headers.get("X-Trace-Id") or LazyStr(_fast_uuid4),
+            span_id=LazyStr(_fast_uuid4),
+            request_id=LazyStr(_fast_request_id)
+        )
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+    quiet = path in _QUIET_PATHS
 
     # 요청 로그
-    logger.info(
-        "http_request_started",
-        message="HTTP request started",
-        http={
-            "method": request.method,
-            "path": str(request.url.path),
-            "client_ip": request.client.host if request.client else None,
-            "user_agent": request.headers.get("user-agent"),
-        }
-    )
-
-    try:
-        response = await call_next(request)
-        duration_ms = (time.time() - start_time) * 1000
-
-        # 응답 로그
-        logger.info(
-            "http_request_completed",
-            message="HTTP request completed",
+    if not quiet or _DEBUG_ENABLED:
+        (logger.debug if quiet else logger.info)(
+            "http_request_started",
+            message="HTTP request started",
             http={
-                "method": request.method,
-                "path": str(request.url.path),
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-                "client_ip": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent"),
+                "method": method,
+                "path": path,
+                "client_ip": client_ip,
+                "user_agent": user_agent,
             }
         )
 
+    try:
+        response = await call_next(request)
+        duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+
+        # 응답 로그 (조용한 경로도 4xx/5xx 응답은 INFO로 남김)
+        status_code = response.status_code
+        quiet = quiet and status_code < 400
+        if not quiet or _DEBUG_ENABLED:
+            (logger.debug if quiet else logger.info)(
+                "http_request_completed",
+                message="HTTP request completed",
+                http={
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "duration_ms": round(duration_ms, 2),
+                    "client_ip": client_ip,
+                    "user_agent": user_agent,
+                }
+            )
+
         return response
     except Exception as exc:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+        # 예외 메시지 포맷은 한 번만 수행
+        error_message = str(exc)
 
         # 에러 로그
         logger.error(
             "http_request_failed",
-            message=f"HTTP request failed: {str(exc)}",
+            message=f"HTTP request failed: {error_message}",
             http={
-                "method": request.method,
-                "path": str(request.url.path),
+                "method": method,
+                "path": path,
                 "duration_ms": round(duration_ms, 2),
-                "client_ip": request.client.host if request.client else None,
+                "client_ip": client_ip,
             },
             error={
                 "type": type(exc).__name__,
-                "message": str(exc),
+                "message": error_message,
             },
             exc_info=True  # 스택 트레이스 및 파일 위치 정보 추가
         )
         raise
     finally:
-        # 컨텍스트 클리어
-        structlog.contextvars.clear_contextvars()
+        # 컨텍스트 해제
+        if context_token is not None:
+            reset_request_context(context_token)
 
 
-@app.get("/")
-async def root():
-    """루트 엔드포인트"""
-    logger.info("root_endpoint_called", message="Root endpoint accessed")
-    return {
+# 루트 응답은 변하지 않으므로 import 시 한 번만 인코딩해 재사용
+_ROOT_RESPONSE = Response(
+    content=orjson.dumps({
         "message": "FastAPI Logging Example",
         "status": "healthy",
         "version": "1.0.0",
         "environment": "production"
-    }
+    }),
+    media_type="application/json",
+)
+
+
+@app.get("/")
+async def root():
+    """루트 엔드포인트"""
+    # "/"는 조용한 경로이므로 요청 로그와 마찬가지로 DEBUG로 기록
+    logger.debug("root_endpoint_called", message="Root endpoint accessed")
+    return _ROOT_RESPONSE
 
 
 @app.get("/health")
 async def health():
     """Detailed health check endpoint"""
-    health_status = await health_checker.get_full_status()
+    snapshot = _health_snapshot
+    if time.monotonic() - snapshot.checked_at >= HEALTH_CACHE_TTL_SECONDS:
+        async with _health_refresh_lock:
+            # 락을 기다리는 동안 다른 요청이 갱신했다면 그 결과를 사용
+            if time.monotonic() - snapshot.checked_at >= HEALTH_CACHE_TTL_SECONDS:
+                health_status = await health_checker.get_full_status()
 
-    logger.info(
-        "health_check_performed",
-        message="Health check performed",
-        context={
-            "status": health_status["status"],
-            "uptime_seconds": health_status["uptime_seconds"]
-        }
-    )
+                logger.info(
+                    "health_check_performed",
+                    message="Health check performed",
+                    context={
+                        "status": health_status["status"],
+                        "uptime_seconds": health_status["uptime_seconds"]
+                    }
+                )
 
-    return health_status
+                snapshot.body = orjson.dumps(health_status)
+                snapshot.checked_at = time.monotonic()
+
+    return Response(content=snapshot.body, media_type="application/json")
 
 
 @app.get("/users/{user_id}")
@@ -186,7 +346,7 @@ async def get_user(user_id: int):
 
     # Check cache first
     cache_key = f"user:{user_id}"
-    cached_user = user_cache.get(cache_key)
+    cached_user = await user_cache.get(cache_key)
 
     if cached_user:
         logger.info(
@@ -197,25 +357,19 @@ async def get_user(user_id: int):
         return cached_user
 
     # 쿼리 실행 시뮬레이션
-    query_start = time.time()
+    query_start = time.perf_counter_ns()
 
     # 실제로는 DB 쿼리 실행
     # 여기서는 시뮬레이션
-    time.sleep(0.045)  # 45ms 쿼리 시간
+    await asyncio.sleep(0.045)  # 45ms 쿼리 시간
 
-    query_duration = (time.time() - query_start) * 1000
+    query_duration = (time.perf_counter_ns() - query_start) / 1_000_000
 
     # 쿼리 로그
     logger.info(
         "database_query_executed",
         message="Database query executed",
-        query={
-            "type": "SELECT",
-            "statement": "SELECT * FROM users WHERE id = ?",
-            "duration_ms": round(query_duration, 2),
-            "rows_affected": 1,
-            "database": "user_db"
-        },
+        query={**_GET_USER_QUERY, "duration_ms": round(query_duration, 2)},
         context={
             "user_id": user_id
         }
@@ -228,7 +382,7 @@ async def get_user(user_id: int):
     }
 
     # Store in cache
-    user_cache.set(cache_key, user_data)
+    await user_cache.set(cache_key, user_data)
 
     return user_data
 
@@ -239,8 +393,7 @@ async def create_user(user_data: dict):
     사용자 생성 엔드포인트 (INSERT 쿼리 로그 예시)
     """
     # Validate required fields
-    required_fields = ["name", "email"]
-    missing_fields = [field for field in required_fields if field not in user_data]
+    missing_fields = [field for field in _REQUIRED_USER_FIELDS if field not in user_data]
 
     if missing_fields:
         logger.warning(
@@ -288,24 +441,18 @@ async def create_user(user_data: dict):
         )
         raise HTTPException(status_code=400, detail="Email address exceeds maximum length")
 
-    query_start = time.time()
+    query_start = time.perf_counter_ns()
 
     # INSERT 시뮬레이션
-    time.sleep(0.032)
+    await asyncio.sleep(0.032)
 
-    query_duration = (time.time() - query_start) * 1000
+    query_duration = (time.perf_counter_ns() - query_start) / 1_000_000
 
     # 쿼리 로그
     logger.info(
         "database_query_executed",
         message="Database query executed",
-        query={
-            "type": "INSERT",
-            "statement": "INSERT INTO users (name, email) VALUES (?, ?)",
-            "duration_ms": round(query_duration, 2),
-            "rows_affected": 1,
-            "database": "user_db"
-        }
+        query={**_CREATE_USER_QUERY, "duration_ms": round(query_duration, 2)}
     )
 
     user_id = 123
@@ -317,7 +464,7 @@ async def create_user(user_data: dict):
 
     # Invalidate cache when new user is created
     cache_key = f"user:{user_id}"
-    user_cache.delete(cache_key)
+    await user_cache.delete(cache_key)
 
     return {"status": "created", "user_id": user_id}
 
@@ -339,10 +486,7 @@ async def trigger_error():
                 "type": type(exc).__name__,
                 "message": str(exc),
             },
-            context={
-                "operation": "divide",
-                "endpoint": "/error"
-            },
+            context=_TRIGGER_ERROR_CONTEXT,
             exc_info=True  # 스택 트레이스 자동 추가 (location도 자동 추가됨)
         )
 
@@ -361,41 +505,26 @@ async def slow_query():
     """
     느린 쿼리 로그 예시 (성능 모니터링)
     """
-    query_start = time.time()
+    query_start = time.perf_counter_ns()
 
     # 느린 쿼리 시뮬레이션 - 성능 개선 적용
-    time.sleep(0.8)  # Optimized from 2.5s to 0.8s with index
+    await asyncio.sleep(0.8)  # Optimized from 2.5s to 0.8s with index
 
-    query_duration = (time.time() - query_start) * 1000
+    query_duration = (time.perf_counter_ns() - query_start) / 1_000_000
 
     # Performance improved but still log for monitoring
     if query_duration > 1000:
         logger.warning(
             "slow_query_detected",
             message="Slow database query detected",
-            query={
-                "type": "SELECT",
-                "statement": "SELECT * FROM large_table WHERE complex_condition = ? -- optimized with index",
-                "duration_ms": round(query_duration, 2),
-                "rows_affected": 1000,
-                "database": "analytics_db"
-            },
-            context={
-                "threshold_ms": 1000,
-                "warning": "Query exceeded performance threshold"
-            }
+            query={**_SLOW_QUERY, "duration_ms": round(query_duration, 2)},
+            context=_SLOW_QUERY_CONTEXT
         )
     else:
         logger.info(
             "database_query_executed",
             message="Database query executed",
-            query={
-                "type": "SELECT",
-                "statement": "SELECT * FROM large_table WHERE complex_condition = ? -- optimized with index",
-                "duration_ms": round(query_duration, 2),
-                "rows_affected": 1000,
-                "database": "analytics_db"
-            }
+            query={**_SLOW_QUERY, "duration_ms": round(query_duration, 2)}
         )
 
     return {"status": "completed", "duration_ms": round(query_duration, 2)}
@@ -405,120 +534,320 @@ async def slow_query():
 # 다양한 에러 시나리오 (RAG 테스트용)
 # ============================================================
 
-@app.get("/test/null-pointer")
-async def test_null_pointer():
-    """Null/None Reference Error"""
-    try:
-        user = None
-        user_name = user.name  # AttributeError 발생
-        return {"name": user_name}
-    except Exception as exc:
-        logger.error(
-            "null_pointer_exception",
-            message="Null pointer exception occurred",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "access_attribute",
-                "endpoint": "/test/null-pointer",
-                "attempted_access": "user.name"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Cannot access attribute of None")
+def _raise_null_pointer():
+    user = None
+    return user.name  # AttributeError 발생
 
 
-@app.get("/test/attribute-error")
-async def test_attribute_error():
-    """Attribute Error (유사 시나리오 1)"""
-    try:
-        data = {"key": "value"}
-        result = data.nonexistent_attribute  # AttributeError 발생
-        return {"result": result}
-    except Exception as exc:
-        logger.error(
-            "attribute_error",
-            message="Attribute access error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "read_attribute",
-                "endpoint": "/test/attribute-error",
-                "attempted_access": "data.nonexistent_attribute"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Attribute does not exist")
+def _raise_attribute_error():
+    data = {"key": "value"}
+    return data.nonexistent_attribute  # AttributeError 발생
 
 
-@app.get("/test/index-out-of-range")
-async def test_index_out_of_range():
-    """List Index Out of Range"""
-    try:
-        items = ['a', 'b', 'c']
-        item = items[10]  # IndexError 발생
-        return {"item": item}
-    except IndexError as exc:
-        logger.error(
-            "index_out_of_range",
-            message="List index out of range error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "list_access",
-                "endpoint": "/test/index-out-of-range",
-                "list_length": 3,
-                "attempted_index": 10
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Index out of range")
+def _raise_index_error():
+    items = ['a', 'b', 'c']
+    return items[10]  # IndexError 발생
 
 
-@app.get("/test/key-error")
-async def test_key_error():
-    """Dictionary Key Error (유사 시나리오 2)"""
-    try:
-        data = {"name": "test", "age": 30}
-        value = data["nonexistent_key"]  # KeyError 발생
-        return {"value": value}
-    except KeyError as exc:
-        logger.error(
-            "key_error",
-            message="Dictionary key not found",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "dict_access",
-                "endpoint": "/test/key-error",
-                "available_keys": list({"name": "test", "age": 30}.keys()),
-                "requested_key": "nonexistent_key"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Key not found in dictionary")
+def _raise_key_error():
+    data = {"name": "test", "age": 30}
+    return data["nonexistent_key"]  # KeyError 발생
+
+
+def _raise_connection_refused():
+    raise ConnectionRefusedError("Connection refused: ECONNREFUSED 127.0.0.1:5432")
+
+
+def _raise_redis_connection_error():
+    raise ConnectionError("Redis connection failed: connect ECONNREFUSED 127.0.0.1:6379")
+
+
+def _raise_redis_timeout():
+    raise TimeoutError("Redis operation timeout: GET operation exceeded 2000ms")
+
+
+_INVALID_JSON = '{name: "test", invalid}'
+
+
+def _raise_json_decode_error():
+    return json.loads(_INVALID_JSON)
+
+
+def _raise_type_conversion_error():
+    value = "not a number"
+    return int(value)  # ValueError 발생
+
+
+_MISSING_CONFIG_PATH = '/nonexistent/path/config.json'
+
+
+def _raise_file_not_found():
+    with open(_MISSING_CONFIG_PATH, 'r') as f:
+        return f.read()
+
+
+def _raise_permission_error():
+    raise PermissionError("[Errno 13] Permission denied: '/etc/protected/config.json'")
+
+
+def _raise_recursion_error():
+    def recursive_function(depth):
+        return recursive_function(depth + 1)
+
+    return recursive_function(0)
+
+
+def _raise_http_client_error():
+    raise Exception("HTTP request failed: connect ETIMEDOUT external-api.com:443")
+
+
+def _raise_circuit_breaker_open():
+    raise Exception("Circuit breaker is OPEN: too many failures detected for external-api.com")
+
+
+def _raise_rate_limit_exceeded():
+    raise Exception("Rate limit exceeded: 429 Too Many Requests")
+
+
+def _raise_auth_token_expired():
+    raise Exception("JWT token expired at 2025-10-15T12:00:00Z")
+
+
+def _raise_import_error():
+    import nonexistent_module  # noqa: F401
+
+
+@dataclass(slots=True, frozen=True)
+class _ErrorScenario:
+    """예외를 발생시키고 동일한 형태의 에러 로그를 남기는 /test/* 시나리오 정의"""
+
+    path: str
+    name: str
+    doc: str
+    trigger: Callable[[], Any]
+    catch: Type[BaseException]
+    event: str
+    message: str
+    context: Dict[str, Any]
+    status_code: int
+    detail: str
+    # 예외 객체에서만 알 수 있는 컨텍스트 필드 (없으면 고정 context만 사용)
+    exc_context: Optional[Callable[[BaseException], Dict[str, Any]]] = None
+    # 스택 트레이스 포함 여부 (raise 한 줄짜리 가짜 예외는 트레이스 포맷 비용만 들고 정보가 없음)
+    exc_info: bool = True
+
+
+_ERROR_SCENARIOS = (
+    _ErrorScenario(
+        "/test/null-pointer", "test_null_pointer", "Null/None Reference Error",
+        _raise_null_pointer, Exception,
+        "null_pointer_exception", "Null pointer exception occurred",
+        {"operation": "access_attribute", "endpoint": "/test/null-pointer",
+         "attempted_access": "user.name"},
+        500, "Cannot access attribute of None",
+    ),
+    _ErrorScenario(
+        "/test/attribute-error", "test_attribute_error", "Attribute Error (유사 시나리오 1)",
+        _raise_attribute_error, Exception,
+        "attribute_error", "Attribute access error",
+        {"operation": "read_attribute", "endpoint": "/test/attribute-error",
+         "attempted_access": "data.nonexistent_attribute"},
+        500, "Attribute does not exist",
+    ),
+    _ErrorScenario(
+        "/test/index-out-of-range", "test_index_out_of_range", "List Index Out of Range",
+        _raise_index_error, IndexError,
+        "index_out_of_range", "List index out of range error",
+        {"operation": "list_access", "endpoint": "/test/index-out-of-range",
+         "list_length": 3, "attempted_index": 10},
+        500, "Index out of range",
+    ),
+    _ErrorScenario(
+        "/test/key-error", "test_key_error", "Dictionary Key Error (유사 시나리오 2)",
+        _raise_key_error, KeyError,
+        "key_error", "Dictionary key not found",
+        {"operation": "dict_access", "endpoint": "/test/key-error",
+         "available_keys": ["name", "age"], "requested_key": "nonexistent_key"},
+        500, "Key not found in dictionary",
+    ),
+    _ErrorScenario(
+        "/test/db-connection-refused", "test_db_connection_refused",
+        "Database Connection Refused (유사 시나리오 3)",
+        _raise_connection_refused, Exception,
+        "db_connection_refused", "Database connection refused",
+        {"operation": "db_connect", "endpoint": "/test/db-connection-refused",
+         "database": "postgresql", "host": "127.0.0.1", "port": 5432,
+         "error_code": "ECONNREFUSED"},
+        503, "Database connection refused",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/redis-connection-error", "test_redis_connection_error", "Redis Connection Error",
+        _raise_redis_connection_error, Exception,
+        "redis_connection_error", "Redis connection error",
+        {"operation": "redis_connect", "endpoint": "/test/redis-connection-error",
+         "redis_host": "127.0.0.1", "redis_port": 6379, "error_code": "ECONNREFUSED"},
+        503, "Redis connection failed",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/redis-timeout", "test_redis_timeout", "Redis Operation Timeout (유사 시나리오 4)",
+        _raise_redis_timeout, Exception,
+        "redis_timeout", "Redis operation timeout",
+        {"operation": "redis_get", "endpoint": "/test/redis-timeout",
+         "redis_host": "127.0.0.1", "redis_port": 6379, "timeout_ms": 2000,
+         "redis_operation": "GET"},
+        504, "Redis operation timeout",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/json-decode-error", "test_json_decode_error", "JSON Decode Error",
+        _raise_json_decode_error, json.JSONDecodeError,
+        "json_decode_error", "JSON decode error",
+        {"operation": "parse_json", "endpoint": "/test/json-decode-error",
+         "input": _INVALID_JSON},
+        400, "Invalid JSON format",
+        exc_context=lambda exc: {"line": exc.lineno, "column": exc.colno},
+    ),
+    _ErrorScenario(
+        "/test/type-error", "test_type_error", "Type Conversion Error (유사 시나리오 5)",
+        _raise_type_conversion_error, ValueError,
+        "type_conversion_error", "Type conversion error",
+        {"operation": "type_convert", "endpoint": "/test/type-error",
+         "from_type": "string", "to_type": "int", "value": "not a number"},
+        400, "Type conversion failed",
+    ),
+    _ErrorScenario(
+        "/test/file-not-found", "test_file_not_found", "File Not Found Error",
+        _raise_file_not_found, FileNotFoundError,
+        "file_not_found", "File not found error",
+        {"operation": "read_file", "endpoint": "/test/file-not-found",
+         "file_path": _MISSING_CONFIG_PATH},
+        500, "Configuration file not found",
+        exc_context=lambda exc: {"error_code": exc.errno},
+    ),
+    _ErrorScenario(
+        "/test/permission-error", "test_permission_error", "Permission Denied Error (유사 시나리오 6)",
+        _raise_permission_error, PermissionError,
+        "permission_denied", "Permission denied error",
+        {"operation": "write_file", "endpoint": "/test/permission-error",
+         "file_path": "/etc/protected/config.json", "error_code": 13},
+        500, "Permission denied",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/recursion-error", "test_recursion_error", "Recursion Error / Stack Overflow",
+        _raise_recursion_error, RecursionError,
+        "recursion_error", "Maximum recursion depth exceeded",
+        {"operation": "recursive_call", "endpoint": "/test/recursion-error",
+         "recursion_depth": "exceeded"},
+        500, "Maximum recursion depth exceeded",
+    ),
+    _ErrorScenario(
+        "/test/http-client-error", "test_http_client_error", "HTTP Client Request Error",
+        _raise_http_client_error, Exception,
+        "http_client_error", "HTTP client request error",
+        {"operation": "http_request", "endpoint": "/test/http-client-error",
+         "target_url": "https://external-api.com/api/data", "error_code": "ETIMEDOUT",
+         "timeout_ms": 5000},
+        502, "External API request failed",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/circuit-breaker-open", "test_circuit_breaker_open",
+        "Circuit Breaker Open Error (유사 시나리오 7)",
+        _raise_circuit_breaker_open, Exception,
+        "circuit_breaker_open", "Circuit breaker open",
+        {"operation": "http_request", "endpoint": "/test/circuit-breaker-open",
+         "target_service": "external-api.com", "circuit_state": "OPEN",
+         "failure_count": 5, "threshold": 5},
+        503, "Service temporarily unavailable (circuit breaker open)",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/rate-limit-exceeded", "test_rate_limit_exceeded", "Rate Limit Exceeded",
+        _raise_rate_limit_exceeded, Exception,
+        "rate_limit_exceeded", "Rate limit exceeded",
+        {"operation": "api_call", "endpoint": "/test/rate-limit-exceeded",
+         "rate_limit": 100, "window": "1 minute", "current_count": 105},
+        429, "Too many requests",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/auth-token-expired", "test_auth_token_expired", "Authentication Token Expired",
+        _raise_auth_token_expired, Exception,
+        "auth_token_expired", "Authentication token expired",
+        {"operation": "authenticate", "endpoint": "/test/auth-token-expired",
+         "token_type": "JWT", "expired_at": "2025-10-15T12:00:00Z"},
+        401, "Token expired",
+        exc_info=False,
+    ),
+    _ErrorScenario(
+        "/test/import-error", "test_import_error", "Import/Module Not Found Error",
+        _raise_import_error, ImportError,
+        "import_error", "Module import failed",
+        {"operation": "import_module", "endpoint": "/test/import-error",
+         "module_name": "nonexistent_module"},
+        500, "Module import failed",
+    ),
+)
+
+
+def _make_error_handler(scenario: _ErrorScenario):
+    """
+    시나리오 하나에 대한 엔드포인트 생성
+    고정 값은 클로저에 미리 풀어두어 요청마다 속성 조회를 하지 않음
+    """
+    trigger = scenario.trigger
+    catch = scenario.catch
+    event = scenario.event
+    message = scenario.message
+    context = scenario.context
+    exc_context = scenario.exc_context
+    status_code = scenario.status_code
+    detail = scenario.detail
+    exc_info = scenario.exc_info
+
+    async def handler():
+        try:
+            trigger()
+        except catch as exc:
+            logger.error(
+                event,
+                message=message,
+                error={
+                    "type": type(exc).__name__,
+                    "message": str(exc),
+                },
+                context=context if exc_context is None else {**context, **exc_context(exc)},
+                exc_info=exc_info
+            )
+            raise HTTPException(status_code=status_code, detail=detail)
+        return {"status": "ok"}
+
+    # 트레이스백과 스택 트레이스에 공용 "handler" 대신 시나리오 이름이 나오도록 함
+    handler.__code__ = handler.__code__.replace(co_name=scenario.name)
+    handler.__name__ = handler.__qualname__ = scenario.name
+    handler.__doc__ = scenario.doc
+    return handler
+
+
+for _scenario in _ERROR_SCENARIOS:
+    app.add_api_route(_scenario.path, _make_error_handler(_scenario), methods=["GET"])
+del _scenario
 
 
 @app.get("/test/db-connection-timeout")
 async def test_db_connection_timeout():
     """Database Connection Timeout"""
-    import asyncio
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     try:
         # DB 연결 타임아웃 시뮬레이션
         await asyncio.sleep(0.1)
         raise TimeoutError("Connection timeout: Unable to connect to database after 5000ms")
     except Exception as exc:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
         logger.error(
             "db_connection_timeout",
@@ -536,213 +865,36 @@ async def test_db_connection_timeout():
                 "timeout_ms": 5000,
                 "duration_ms": round(duration_ms, 2)
             },
-            exc_info=True
+            exc_info=False  # 직접 raise한 예외라 트레이스에 추가 정보가 없음
         )
         raise HTTPException(status_code=503, detail="Database connection timeout")
 
 
-@app.get("/test/db-connection-refused")
-async def test_db_connection_refused():
-    """Database Connection Refused (유사 시나리오 3)"""
-    try:
-        raise ConnectionRefusedError("Connection refused: ECONNREFUSED 127.0.0.1:5432")
-    except Exception as exc:
-        logger.error(
-            "db_connection_refused",
-            message="Database connection refused",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "db_connect",
-                "endpoint": "/test/db-connection-refused",
-                "database": "postgresql",
-                "host": "127.0.0.1",
-                "port": 5432,
-                "error_code": "ECONNREFUSED"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=503, detail="Database connection refused")
-
-
-@app.get("/test/redis-connection-error")
-async def test_redis_connection_error():
-    """Redis Connection Error"""
-    try:
-        raise ConnectionError("Redis connection failed: connect ECONNREFUSED 127.0.0.1:6379")
-    except Exception as exc:
-        logger.error(
-            "redis_connection_error",
-            message="Redis connection error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "redis_connect",
-                "endpoint": "/test/redis-connection-error",
-                "redis_host": "127.0.0.1",
-                "redis_port": 6379,
-                "error_code": "ECONNREFUSED"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=503, detail="Redis connection failed")
-
-
-@app.get("/test/redis-timeout")
-async def test_redis_timeout():
-    """Redis Operation Timeout (유사 시나리오 4)"""
-    try:
-        raise TimeoutError("Redis operation timeout: GET operation exceeded 2000ms")
-    except Exception as exc:
-        logger.error(
-            "redis_timeout",
-            message="Redis operation timeout",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "redis_get",
-                "endpoint": "/test/redis-timeout",
-                "redis_host": "127.0.0.1",
-                "redis_port": 6379,
-                "timeout_ms": 2000,
-                "redis_operation": "GET"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=504, detail="Redis operation timeout")
-
-
-@app.get("/test/json-decode-error")
-async def test_json_decode_error():
-    """JSON Decode Error"""
-    import json
-    try:
-        invalid_json = '{name: "test", invalid}'
-        parsed = json.loads(invalid_json)
-        return parsed
-    except json.JSONDecodeError as exc:
-        logger.error(
-            "json_decode_error",
-            message="JSON decode error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "parse_json",
-                "endpoint": "/test/json-decode-error",
-                "input": invalid_json,
-                "line": exc.lineno,
-                "column": exc.colno
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=400, detail="Invalid JSON format")
-
-
-@app.get("/test/type-error")
-async def test_type_error():
-    """Type Conversion Error (유사 시나리오 5)"""
-    try:
-        value = "not a number"
-        number = int(value)  # ValueError 발생
-        return {"number": number}
-    except ValueError as exc:
-        logger.error(
-            "type_conversion_error",
-            message="Type conversion error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "type_convert",
-                "endpoint": "/test/type-error",
-                "from_type": "string",
-                "to_type": "int",
-                "value": "not a number"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=400, detail="Type conversion failed")
-
-
-@app.get("/test/file-not-found")
-async def test_file_not_found():
-    """File Not Found Error"""
-    try:
-        with open('/nonexistent/path/config.json', 'r') as f:
-            content = f.read()
-        return {"content": content}
-    except FileNotFoundError as exc:
-        logger.error(
-            "file_not_found",
-            message="File not found error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "read_file",
-                "endpoint": "/test/file-not-found",
-                "file_path": "/nonexistent/path/config.json",
-                "error_code": exc.errno
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Configuration file not found")
-
-
-@app.get("/test/permission-error")
-async def test_permission_error():
-    """Permission Denied Error (유사 시나리오 6)"""
-    try:
-        raise PermissionError("[Errno 13] Permission denied: '/etc/protected/config.json'")
-    except PermissionError as exc:
-        logger.error(
-            "permission_denied",
-            message="Permission denied error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "write_file",
-                "endpoint": "/test/permission-error",
-                "file_path": "/etc/protected/config.json",
-                "error_code": 13
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Permission denied")
+# 메모리 할당 시뮬레이션 수치 (리스트 원소 1개당 포인터 8바이트 기준)
+_SIMULATED_ALLOCATION_ITEMS = 10_000_000
+_MEMORY_SIMULATION_CONTEXT = {
+    "operation": "memory_allocation",
+    "endpoint": "/test/memory-error",
+    "allocated_items": _SIMULATED_ALLOCATION_ITEMS,
+    "estimated_memory_mb": _SIMULATED_ALLOCATION_ITEMS * 8 / 1024 / 1024
+}
+_MEMORY_SIMULATION_RESPONSE = {
+    "warning": "Memory allocation simulation",
+    "allocated_items": _SIMULATED_ALLOCATION_ITEMS
+}
 
 
 @app.get("/test/memory-error")
 async def test_memory_error():
     """Memory Error Simulation"""
     try:
-        # 메모리 할당 시뮬레이션 (실제로는 메모리 에러를 발생시키지 않음)
-        large_list = [0] * 10000000
+        # 메모리 할당 시뮬레이션 (실제로 할당하지 않고 수치만 기록)
         logger.warning(
             "high_memory_usage",
             message="High memory usage detected",
-            context={
-                "operation": "memory_allocation",
-                "endpoint": "/test/memory-error",
-                "allocated_items": len(large_list),
-                "estimated_memory_mb": len(large_list) * 8 / 1024 / 1024
-            }
+            context=_MEMORY_SIMULATION_CONTEXT
         )
-        return {
-            "warning": "Memory allocation simulation",
-            "allocated_items": len(large_list)
-        }
+        return _MEMORY_SIMULATION_RESPONSE
     except MemoryError as exc:
         logger.error(
             "memory_error",
@@ -760,157 +912,6 @@ async def test_memory_error():
         raise HTTPException(status_code=500, detail="Memory allocation failed")
 
 
-@app.get("/test/recursion-error")
-async def test_recursion_error():
-    """Recursion Error / Stack Overflow"""
-    try:
-        def recursive_function(depth):
-            return recursive_function(depth + 1)
-
-        recursive_function(0)
-        return {"status": "ok"}
-    except RecursionError as exc:
-        logger.error(
-            "recursion_error",
-            message="Maximum recursion depth exceeded",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "recursive_call",
-                "endpoint": "/test/recursion-error",
-                "recursion_depth": "exceeded"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Maximum recursion depth exceeded")
-
-
-@app.get("/test/http-client-error")
-async def test_http_client_error():
-    """HTTP Client Request Error"""
-    try:
-        raise Exception("HTTP request failed: connect ETIMEDOUT external-api.com:443")
-    except Exception as exc:
-        logger.error(
-            "http_client_error",
-            message="HTTP client request error",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "http_request",
-                "endpoint": "/test/http-client-error",
-                "target_url": "https://external-api.com/api/data",
-                "error_code": "ETIMEDOUT",
-                "timeout_ms": 5000
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=502, detail="External API request failed")
-
-
-@app.get("/test/circuit-breaker-open")
-async def test_circuit_breaker_open():
-    """Circuit Breaker Open Error (유사 시나리오 7)"""
-    try:
-        raise Exception("Circuit breaker is OPEN: too many failures detected for external-api.com")
-    except Exception as exc:
-        logger.error(
-            "circuit_breaker_open",
-            message="Circuit breaker open",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "http_request",
-                "endpoint": "/test/circuit-breaker-open",
-                "target_service": "external-api.com",
-                "circuit_state": "OPEN",
-                "failure_count": 5,
-                "threshold": 5
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=503, detail="Service temporarily unavailable (circuit breaker open)")
-
-
-@app.get("/test/rate-limit-exceeded")
-async def test_rate_limit_exceeded():
-    """Rate Limit Exceeded"""
-    try:
-        raise Exception("Rate limit exceeded: 429 Too Many Requests")
-    except Exception as exc:
-        logger.error(
-            "rate_limit_exceeded",
-            message="Rate limit exceeded",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "api_call",
-                "endpoint": "/test/rate-limit-exceeded",
-                "rate_limit": 100,
-                "window": "1 minute",
-                "current_count": 105
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=429, detail="Too many requests")
-
-
-@app.get("/test/auth-token-expired")
-async def test_auth_token_expired():
-    """Authentication Token Expired"""
-    try:
-        raise Exception("JWT token expired at 2025-10-15T12:00:00Z")
-    except Exception as exc:
-        logger.error(
-            "auth_token_expired",
-            message="Authentication token expired",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "authenticate",
-                "endpoint": "/test/auth-token-expired",
-                "token_type": "JWT",
-                "expired_at": "2025-10-15T12:00:00Z"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=401, detail="Token expired")
-
-
-@app.get("/test/import-error")
-async def test_import_error():
-    """Import/Module Not Found Error"""
-    try:
-        import nonexistent_module
-        return {"status": "ok"}
-    except ImportError as exc:
-        logger.error(
-            "import_error",
-            message="Module import failed",
-            error={
-                "type": type(exc).__name__,
-                "message": str(exc),
-            },
-            context={
-                "operation": "import_module",
-                "endpoint": "/test/import-error",
-                "module_name": "nonexistent_module"
-            },
-            exc_info=True
-        )
-        raise HTTPException(status_code=500, detail="Module import failed")
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -2,63 +2,102 @@
 애플리케이션 메트릭 수집 및 모니터링
 """
 from typing import Dict, Any
-from collections import defaultdict
+from collections import deque
+import itertools
 import time
 
 
+# 엔드포인트별로 유지할 최근 응답 시간 개수
+RESPONSE_TIME_WINDOW = 100
+
+
+def _count_value(counter: "itertools.count") -> int:
+    """itertools.count를 증가시키지 않고 현재 값 조회 (repr 형식: "count(N)")"""
+    return int(repr(counter)[6:-1])
+
+
 class MetricsCollector:
-    """메트릭 수집기"""
+    """
+    메트릭 수집기
+
+    스레드풀에서 실행되는 동기 엔드포인트에서도 호출될 수 있으므로 락 없이 안전하게 기록한다.
+    - 카운터는 itertools.count: next()가 단일 C 호출이라 "+= 1"과 달리 증가분이 유실되지 않음
+    - 키별 객체 생성은 dict.setdefault(단일 C 호출)로 처리해 동시에 처음 기록돼도 하나만 남음
+    - deque.append도 원자적이므로 응답 시간 버퍼는 키당 하나로 유지
+    """
 
     def __init__(self):
-        self.request_count = defaultdict(int)
-        self.error_count = defaultdict(int)
-        self.response_times = defaultdict(list)
+        self.request_count: Dict[str, "itertools.count"] = {}
+        self.error_count: Dict[str, "itertools.count"] = {}
+        self.response_times: Dict[str, deque] = {}
         self.start_time = time.time()
 
     def record_request(self, endpoint: str, method: str, status_code: int, duration_ms: float):
         """요청 메트릭 기록"""
         key = f"{method}:{endpoint}"
-        self.request_count[key] += 1
 
-        if status_code >= 400:
-            self.error_count[key] += 1
+        counter = self.request_count.get(key)
+        if counter is None:
+            counter = self.request_count.setdefault(key, itertools.count())
+        next(counter)
 
-        self.response_times[key].append(duration_ms)
-
-        # 최근 100개만 유지
-        if len(self.response_times[key]) > 100:
-            self.response_times[key] = self.response_times[key][-100:]
+        if status_code >= 400:
+            counter = self.error_count.get(key)
+            if counter is None:
+                counter = self.error_count.setdefault(key, itertools.count())
+            next(counter)
+
+        # maxlen deque가 오래된 값을 자동으로 밀어내므로 슬라이스 복사가 필요 없음
+        response_times = self.response_times.get(key)
+        if response_times is None:
+            response_times = self.response_times.setdefault(
+                key, deque(maxlen=RESPONSE_TIME_WINDOW)
+            )
+        response_times.append(duration_ms)
 
     def get_metrics(self) -> Dict[str, Any]:
         """수집된 메트릭 조회"""
+        # 기록 중인 스레드가 키를 추가해도 순회가 깨지지 않도록 스냅샷을 떠서 계산
+        request_counts = {key: _count_value(c) for key, c in list(self.request_count.items())}
+        error_counts = {key: _count_value(c) for key, c in list(self.error_count.items())}
+
         metrics = {
             "uptime_seconds": round(time.time() - self.start_time, 2),
-            "total_requests": sum(self.request_count.values()),
-            "total_errors": sum(self.error_count.values()),
+            "total_requests": sum(request_counts.values()),
+            "total_errors": sum(error_counts.values()),
             "endpoints": {}
         }
 
-        for key in self.request_count:
+        for key, request_count in request_counts.items():
             method, endpoint = key.split(":", 1)
-            response_times = self.response_times.get(key, [])
+            error_count = error_counts.get(key, 0)
+            response_times = self.response_times.get(key)
+            if response_times:
+                response_times = tuple(response_times)
 
             endpoint_metrics = {
                 "method": method,
-                "total_requests": self.request_count[key],
-                "total_errors": self.error_count[key],
+                "total_requests": request_count,
+                "total_errors": error_count,
                 "error_rate": round(
-                    (self.error_count[key] / self.request_count[key] * 100)
-                    if self.request_count[key] > 0 else 0,
+                    (error_count / request_count * 100) if request_count > 0 else 0,
                     2
                 )
             }
 
             if response_times:
-                endpoint_metrics["avg_response_time_ms"] = round(
-                    sum(response_times) / len(response_times), 2
-                )
-                endpoint_metrics["max_response_time_ms"] = round(max(response_times), 2)
-                endpoint_metrics["min_response_time_ms"] = round(min(response_times), 2)
+                # sum/max/min 세 번 순회하는 대신 한 번에 계산
+                total = 0.0
+                lowest = highest = response_times[0]
+                for value in response_times:
+                    total += value
+                    if value < lowest:
+                        lowest = value
+                    elif value > highest:
+                        highest = value
+                endpoint_metrics["avg_response_time_ms"] = round(total / len(response_times), 2)
+                endpoint_metrics["max_response_time_ms"] = round(highest, 2)
+                endpoint_metrics["min_response_time_ms"] = round(lowest, 2)
 
             metrics["endpoints"][endpoint] = endpoint_metrics
 
@@ -1,53 +1,82 @@
 """
 커스텀 미들웨어 모음
+BaseHTTPMiddleware는 요청마다 태스크와 메모리 스트림을 만들기 때문에
+헤더만 다루는 미들웨어는 순수 ASGI 미들웨어로 구현합니다.
 """
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from logger_config import get_logger
 
 logger = get_logger(__name__)
 
+# 느린 요청 경고 기준 (ms)
+SLOW_REQUEST_THRESHOLD_MS = 1000
 
-class RequestTimingMiddleware(BaseHTTPMiddleware):
+# 요청마다 인코딩하지 않도록 bytes 헤더를 미리 생성
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+)
+
+
+class RequestTimingMiddleware:
     """요청 처리 시간 측정 미들웨어"""
 
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        process_time = (time.time() - start_time) * 1000
+        start_time = time.perf_counter_ns()
 
-        # 응답 헤더에 처리 시간 추가
-        response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                # 응답 시작 시점까지의 처리 시간 (call_next가 반환되는 시점과 동일)
+                process_time = (time.perf_counter_ns() - start_time) / 1_000_000
 
-        # 느린 요청 경고
-        if process_time > 1000:
-            logger.warning(
-                "slow_request_detected",
-                message="Slow request detected",
-                context={
-                    "path": str(request.url.path),
-                    "method": request.method,
-                    "process_time_ms": round(process_time, 2),
-                    "threshold_ms": 1000
-                }
-            )
+                # 응답 헤더에 처리 시간 추가
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-process-time", f"{process_time:.2f}ms".encode("latin-1")),
+                ]
 
-        return response
+                # 느린 요청 경고
+                if process_time > SLOW_REQUEST_THRESHOLD_MS:
+                    logger.warning(
+                        "slow_request_detected",
+                        message="Slow request detected",
+                        context={
+                            "path": scope["path"],
+                            "method": scope["method"],
+                            "process_time_ms": round(process_time, 2),
+                            "threshold_ms": SLOW_REQUEST_THRESHOLD_MS
+                        }
+                    )
+            await send(message)
 
+        await self.app(scope, receive, send_wrapper)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+class SecurityHeadersMiddleware:
     """보안 헤더 추가 미들웨어"""
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # 보안 헤더 추가
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                # 보안 헤더 추가
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
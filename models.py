@@ -1,7 +1,14 @@
 """
 SQLAlchemy ORM 모델 정의
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
+import io
+import re
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Index, insert, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, deferred, relationship
 from sqlalchemy.sql import func
 from database import Base
 
@@ -25,15 +32,36 @@ class User(Base):
 class AuditLog(Base):
     """감사 로그 모델"""
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # action별 최근 로그 조회를 정렬 없이 인덱스 범위 스캔으로 처리
+        Index("ix_audit_logs_action_created", "action", "created_at"),
+        # 월별 RANGE 파티션 (보관 기간이 지난 로그는 DELETE 대신 파티션 DROP으로 정리)
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=True)
-    action = Column(String(50), nullable=False, index=True)
+    # 파티션 테이블의 PK는 파티션 키를 포함해야 하므로 (id, created_at)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="SET NULL", name="fk_audit_logs_user_id_users"),
+        nullable=True,
+        index=True,
+    )
+    action = Column(String(50), nullable=False)
     resource = Column(String(100), nullable=False)
-    details = Column(Text, nullable=True)
+    # 목록 조회에서는 쓰지 않는 큰 TEXT 컬럼은 접근할 때 로드
+    # (필요한 조회는 .options(undefer(AuditLog.details)), AsyncSession에서는 반드시 undefer)
+    details = deferred(Column(Text, nullable=True))
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(String(255), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now(), index=True
+    )
+
+    # 대량 적재/보관 기간 스캔에는 users JOIN을 붙이지 않고, 암묵적 지연 로딩(N+1,
+    # AsyncSession에서는 MissingGreenlet)도 막음: 사용자가 필요한 조회는
+    # .options(selectinload(AuditLog.user)) 등으로 명시해야 함
+    user = relationship("User", lazy="raise")
 
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action={self.action}, resource={self.resource})>"
@@ -42,17 +70,213 @@ class AuditLog(Base):
 class ErrorLog(Base):
     """에러 로그 모델"""
     __tablename__ = "error_logs"
+    __table_args__ = (
+        # 서비스/심각도별 최근 로그 조회용 복합 인덱스 (선두 컬럼 단일 인덱스 대체)
+        Index("ix_error_logs_service_created", "service_name", "created_at"),
+        Index("ix_error_logs_severity_created", "severity", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    service_name = Column(String(100), nullable=False, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    service_name = Column(String(100), nullable=False)
     error_type = Column(String(100), nullable=False)
     error_message = Column(Text, nullable=False)
-    stack_trace = Column(Text, nullable=True)
+    # 스택 트레이스는 행마다 수 KB라 목록 조회에서 제외 (필요 시 undefer(ErrorLog.stack_trace))
+    # error_message는 ErrorLogResponse에 포함되므로 지연 로딩하지 않음 (행마다 추가 SELECT 방지)
+    stack_trace = deferred(Column(Text, nullable=True))
     request_path = Column(String(255), nullable=True)
     request_method = Column(String(10), nullable=True)
-    user_id = Column(Integer, nullable=True)
-    severity = Column(String(20), default="ERROR", index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="SET NULL", name="fk_error_logs_user_id_users"),
+        nullable=True,
+        index=True,
+    )
+    severity = Column(String(20), default="ERROR")
+    created_at = Column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now(), index=True
+    )
 
     def __repr__(self):
         return f"<ErrorLog(id={self.id}, error_type={self.error_type}, severity={self.severity})>"
+
+
+# 월별 파티션을 쓰는 로그 테이블
+LOG_PARTITIONED_TABLES = (AuditLog.__tablename__, ErrorLog.__tablename__)
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    """day가 속한 달에서 offset개월 이동한 달의 1일"""
+    months = day.year * 12 + day.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def month_partition_name(table: str, month: date) -> str:
+    """월별 파티션 테이블 이름 (예: error_logs_2025_10)"""
+    return f"{table}_{month.year:04d}_{month.month:02d}"
+
+
+def _quote(session: Session, name: str) -> str:
+    """DDL에 넣을 식별자를 DB 방언 규칙대로 따옴표 처리"""
+    return session.get_bind().dialect.identifier_preparer.quote_identifier(name)
+
+
+def _month_bound(month: date) -> datetime:
+    """파티션 경계 (해당 월 1일 UTC 자정)"""
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+
+
+def _list_partitions(session: Session, table: str) -> List[str]:
+    """부모 테이블에 붙어 있는 파티션 이름 목록"""
+    rows = session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in rows]
+
+
+def ensure_log_partitions(
+    session: Session, today: date, months_ahead: int = 2
+) -> Tuple[List[str], List[str]]:
+    """
+    이번 달부터 months_ahead개월 뒤까지의 월별 파티션을 미리 생성 (이미 있으면 건너뜀)
+    파티션 경계는 UTC 자정 기준이다. (커밋은 호출자가 수행)
+
+    default 파티션에 해당 달 범위의 행이 이미 있으면 생성이 실패하므로
+    파티션마다 SAVEPOINT 안에서 만들고, 실패한 것은 건너뛰어 나머지는 계속 진행한다.
+    (생성한 이름 목록, 실패한 이름 목록)을 반환한다.
+    """
+    created, failed = [], []
+    for table in LOG_PARTITIONED_TABLES:
+        existing = set(_list_partitions(session, table))
+        for offset in range(months_ahead + 1):
+            start = _month_start(today, offset)
+            name = month_partition_name(table, start)
+            if name in existing:
+                continue
+            statement = text(
+                f"CREATE TABLE IF NOT EXISTS {_quote(session, name)} "
+                f"PARTITION OF {_quote(session, table)} "
+                "FOR VALUES FROM (:start) TO (:end)"
+            )
+            try:
+                with session.begin_nested():
+                    session.execute(
+                        statement,
+                        {"start": _month_bound(start), "end": _month_bound(_month_start(start, 1))},
+                    )
+            except DBAPIError:
+                failed.append(name)
+            else:
+                created.append(name)
+    return created, failed
+
+
+def drop_expired_log_partitions(session: Session, cutoff: date) -> List[str]:
+    """
+    범위 전체가 cutoff 이전인 월별 파티션을 DROP (DELETE + VACUUM 없이 공간을 바로 반환)
+    삭제한 파티션 이름 목록을 반환한다. (커밋은 호출자가 수행)
+    """
+    dropped = []
+    for table in LOG_PARTITIONED_TABLES:
+        pattern = re.compile(rf"^{re.escape(table)}_(\d{{4}})_(\d{{2}})$")
+        for name in _list_partitions(session, table):
+            match = pattern.match(name)
+            if match is None:
+                # default 파티션 등 월별 파티션이 아닌 것은 그대로 둠
+                continue
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            if _month_start(month, 1) <= cutoff:
+                session.execute(text(f"DROP TABLE IF EXISTS {_quote(session, name)}"))
+                dropped.append(name)
+    return dropped
+
+
+# 이 건수 이상이면 INSERT 대신 COPY로 한 번에 적재
+COPY_THRESHOLD = 100
+
+
+def _csv_field(value: Any) -> str:
+    """
+    COPY csv 형식 필드로 변환
+    None은 따옴표 없는 빈 필드(NULL), 그 외 값은 항상 따옴표로 감싸
+    빈 문자열과 NULL을 구분하고 줄바꿈/쉼표가 든 스택 트레이스도 안전하게 적재한다.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    text = value if isinstance(value, str) else str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _bulk_insert(
+    session: Session,
+    model: Type[Base],
+    columns: Sequence[str],
+    defaults: Dict[str, Any],
+    rows: List[Dict[str, Any]],
+) -> int:
+    """
+    append 전용 로그 테이블 대량 적재 (동기 세션, psycopg2 전용)
+
+    COPY_THRESHOLD 미만은 일반 ORM insert(executemany)로, 이상은
+    "COPY ... FROM STDIN (FORMAT csv)" 한 번으로 적재한다.
+    COPY는 Python 측 컬럼 기본값을 적용하지 않으므로 defaults로 채운다.
+    created_at은 파티션 키이자 PK(NOT NULL)이므로 항상 보내고,
+    값이 없는 행은 배치 시작 시각으로 채운다 (행마다 컬럼 구성이 달라지지 않게 함).
+    """
+    if not rows:
+        return 0
+
+    # 모든 행을 같은 컬럼 구성으로 맞춤 (누락 컬럼은 기본값 또는 NULL)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            **{col: row.get(col, defaults.get(col)) for col in columns},
+            "created_at": row.get("created_at") or now,
+        }
+        for row in rows
+    ]
+
+    if len(rows) < COPY_THRESHOLD:
+        session.execute(insert(model), rows)
+        return len(rows)
+
+    copy_columns = [*columns, "created_at"]
+
+    buf = io.StringIO()
+    write = buf.write
+    for row in rows:
+        write(",".join([_csv_field(row.get(col)) for col in copy_columns]))
+        write("\n")
+    buf.seek(0)
+
+    sql = f"COPY {model.__tablename__} ({', '.join(copy_columns)}) FROM STDIN WITH (FORMAT csv)"
+    with session.connection().connection.cursor() as cursor:
+        cursor.copy_expert(sql, buf)
+    return len(rows)
+
+
+_ERROR_LOG_COLUMNS = (
+    "service_name", "error_type", "error_message", "stack_trace",
+    "request_path", "request_method", "user_id", "severity",
+)
+_AUDIT_LOG_COLUMNS = (
+    "user_id", "action", "resource", "details", "ip_address", "user_agent",
+)
+
+
+def bulk_insert_error_logs(session: Session, rows: List[Dict[str, Any]]) -> int:
+    """에러 로그 대량 적재 (커밋은 호출자가 수행)"""
+    return _bulk_insert(session, ErrorLog, _ERROR_LOG_COLUMNS, {"severity": "ERROR"}, rows)
+
+
+def bulk_insert_audit_logs(session: Session, rows: List[Dict[str, Any]]) -> int:
+    """감사 로그 대량 적재 (커밋은 호출자가 수행)"""
+    return _bulk_insert(session, AuditLog, _AUDIT_LOG_COLUMNS, {}, rows)
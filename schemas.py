@@ -2,12 +2,19 @@
 Pydantic 스키마 정의
 API 요청/응답 데이터 검증 및 직렬화
 """
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+import re
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, computed_field, field_validator
+from typing import Generic, Optional, List, TypeVar
 from datetime import datetime
 from enum import Enum
 
 
+# 비밀번호 강도 검사용 정규식 (문자 단위 Python 루프 대신 C 정규식 엔진에서 검사)
+_HAS_DIGIT = re.compile(r"\d").search
+_HAS_UPPER = re.compile(r"[A-Z]").search
+
+
 class StatusEnum(str, Enum):
     """상태 enum"""
     ACTIVE = "active"
@@ -32,12 +39,13 @@ class UserCreate(BaseModel):
     password: str = Field(..., min_length=8)
     full_name: Optional[str] = None
 
-    @validator("password")
-    def password_strength(cls, v):
+    @field_validator("password")
+    @classmethod
+    def password_strength(cls, v: str) -> str:
         """비밀번호 강도 검증"""
-        if not any(char.isdigit() for char in v):
+        if not _HAS_DIGIT(v):
             raise ValueError("비밀번호는 최소 1개의 숫자를 포함해야 합니다")
-        if not any(char.isupper() for char in v):
+        if not _HAS_UPPER(v):
             raise ValueError("비밀번호는 최소 1개의 대문자를 포함해야 합니다")
         return v
 
@@ -51,8 +59,7 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdate(BaseModel):
@@ -83,8 +90,7 @@ class ErrorLogResponse(BaseModel):
     severity: SeverityEnum
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditLogCreate(BaseModel):
@@ -105,8 +111,7 @@ class AuditLogResponse(BaseModel):
     resource: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HealthCheckResponse(BaseModel):
@@ -119,26 +124,31 @@ class HealthCheckResponse(BaseModel):
 
 
 class PaginationParams(BaseModel):
-    """페이지네이션 파라미터"""
+    """페이지네이션 파라미터 (불변)"""
+    model_config = ConfigDict(frozen=True)
+
     page: int = Field(1, ge=1)
     page_size: int = Field(10, ge=1, le=100)
 
-    @property
+    @computed_field
+    @cached_property
     def offset(self) -> int:
+        """조회 시작 위치 (값이 바뀌지 않으므로 처음 접근 시 한 번만 계산)"""
         return (self.page - 1) * self.page_size
 
 
-class PaginatedResponse(BaseModel):
-    """페이지네이션 응답"""
-    items: List[BaseModel]
+T = TypeVar("T")
+
+
+class PaginatedResponse(BaseModel, Generic[T]):
+    """페이지네이션 응답 (PaginatedResponse[UserResponse]처럼 항목 타입을 지정)"""
+    items: List[T]
     total: int
     page: int
     page_size: int
-    total_pages: int
-
-    @validator("total_pages", pre=True, always=True)
-    def calculate_total_pages(cls, v, values):
-        """총 페이지 수 계산"""
-        total = values.get("total", 0)
-        page_size = values.get("page_size", 10)
-        return (total + page_size - 1) // page_size if page_size > 0 else 0
+
+    @computed_field
+    @property
+    def total_pages(self) -> int:
+        """총 페이지 수 (직렬화 시점에 계산)"""
+        return -(-self.total // self.page_size) if self.page_size > 0 else 0
@@ -5,12 +5,35 @@ Celery 백그라운드 작업 정의
 from celery import Celery
 from celery.schedules import crontab
 import smtplib
+import threading
 from email.mime.text import MIMEText
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 import logging
 
+from config import settings
+from database import SessionLocal
+from models import (
+    bulk_insert_audit_logs,
+    bulk_insert_error_logs,
+    drop_expired_log_partitions,
+    ensure_log_partitions,
+)
+
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# 로그 보관 기간 (일) 및 미리 만들어 둘 월별 파티션 수
+LOG_RETENTION_DAYS = 30
+LOG_PARTITION_MONTHS_AHEAD = 2
+
+# 일일 리포트 지표 기본값 (호출마다 리터럴을 새로 만들지 않고 복사해 사용)
+_EMPTY_REPORT_METRICS = {
+    "total_requests": 0,
+    "error_count": 0,
+    "avg_response_time": 0
+}
+
 # Celery 인스턴스 생성
 celery_app = Celery(
     "fastapi_tasks",
@@ -27,24 +50,77 @@ celery_app.conf.update(
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30분
-    worker_prefetch_multiplier=4,
+    # I/O 위주 작업(SMTP, DB)이므로 워커당 하나씩만 미리 가져와
+    # 느린 작업 뒤에 다른 작업이 예약된 채 묶이지 않게 함
+    worker_prefetch_multiplier=1,
+    # 작업 완료 후 ack (워커가 죽으면 다른 워커가 재처리)
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    broker_connection_retry_on_startup=True,
 )
 
 
+# SMTP 연결 타임아웃 (초)
+SMTP_TIMEOUT_SECONDS = 10
+
+# 워커 스레드별 SMTP 연결 (작업마다 TCP/TLS 핸드셰이크와 로그인을 반복하지 않음)
+_smtp_local = threading.local()
+
+
+def _get_smtp() -> smtplib.SMTP:
+    """현재 스레드의 SMTP 연결을 반환 (없으면 연결 후 캐시)"""
+    server = getattr(_smtp_local, "server", None)
+    if server is None:
+        server = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=SMTP_TIMEOUT_SECONDS)
+        try:
+            server.starttls()
+            if settings.smtp_user:
+                server.login(settings.smtp_user, settings.smtp_password or "")
+        except BaseException:
+            # 핸드셰이크/로그인 실패 시 캐시되지 않은 연결의 소켓을 닫음
+            server.close()
+            raise
+        _smtp_local.server = server
+    return server
+
+
+def _reset_smtp() -> None:
+    """캐시된 SMTP 연결을 닫고 버림 (다음 전송 시 재연결)"""
+    server = getattr(_smtp_local, "server", None)
+    _smtp_local.server = None
+    if server is not None:
+        try:
+            server.close()
+        except OSError:
+            pass
+
+
+def _send_message(msg: MIMEText) -> None:
+    """캐시된 연결로 전송, 서버가 유휴 연결을 끊었으면 한 번 재연결 후 재시도"""
+    try:
+        try:
+            _get_smtp().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            _reset_smtp()
+            _get_smtp().send_message(msg)
+    except BaseException:
+        # 재시도까지 실패하면 깨진 연결을 다음 작업이 재사용하지 않도록 버림
+        _reset_smtp()
+        raise
+
+
 @celery_app.task(name="tasks.send_email")
 def send_email(to: str, subject: str, body: str):
     """이메일 전송 작업"""
     try:
         msg = MIMEText(body)
         msg["Subject"] = subject
-        msg["From"] = "noreply@example.com"
+        msg["From"] = settings.smtp_from
         msg["To"] = to
 
-        # SMTP 서버 연결 (실제 환경에서는 설정 파일에서 로드)
-        # with smtplib.SMTP("smtp.example.com", 587) as server:
-        #     server.starttls()
-        #     server.login("username", "password")
-        #     server.send_message(msg)
+        # SMTP 서버가 설정된 경우에만 실제 전송
+        if settings.smtp_host:
+            _send_message(msg)
 
         logger.info(f"이메일 전송 완료: {to}, 제목: {subject}")
         return {"status": "success", "to": to}
@@ -57,11 +133,13 @@ def send_email(to: str, subject: str, body: str):
 def process_data(data: dict):
     """데이터 처리 작업"""
     try:
-        logger.info(f"데이터 처리 시작: {data}")
+        # 로그가 꺼져 있으면 data 문자열 변환을 하지 않도록 지연 포맷 사용
+        logger.info("데이터 처리 시작: %s", data)
         # 데이터 처리 로직
         processed = {
             "original": data,
-            "processed_at": datetime.now().isoformat(),
+            # 로컬 시간대 조회 없이 UTC 기준, 밀리초까지만 포맷
+            "processed_at": datetime.now(_UTC).isoformat(timespec="milliseconds"),
             "status": "completed"
         }
         logger.info("데이터 처리 완료")
@@ -71,15 +149,76 @@ def process_data(data: dict):
         raise
 
 
+@celery_app.task(name="tasks.store_error_logs")
+def store_error_logs(rows: list):
+    """
+    에러 로그 배치 저장 작업
+    요청 경로에서 행마다 INSERT하지 않고 모아 보낸 배치를 한 번에 적재 (대량이면 COPY)
+    """
+    try:
+        with SessionLocal() as session:
+            count = bulk_insert_error_logs(session, rows)
+            session.commit()
+        logger.info("에러 로그 저장 완료: %s건", count)
+        return {"status": "success", "inserted": count}
+    except Exception as e:
+        logger.error(f"에러 로그 저장 실패: {str(e)}")
+        raise
+
+
+@celery_app.task(name="tasks.store_audit_logs")
+def store_audit_logs(rows: list):
+    """감사 로그 배치 저장 작업 (대량이면 COPY)"""
+    try:
+        with SessionLocal() as session:
+            count = bulk_insert_audit_logs(session, rows)
+            session.commit()
+        logger.info("감사 로그 저장 완료: %s건", count)
+        return {"status": "success", "inserted": count}
+    except Exception as e:
+        logger.error(f"감사 로그 저장 실패: {str(e)}")
+        raise
+
+
 @celery_app.task(name="tasks.cleanup_old_logs")
 def cleanup_old_logs():
-    """오래된 로그 정리 작업"""
+    """
+    오래된 로그 정리 작업
+    로그 테이블은 월별 파티션이므로 보관 기간이 지난 파티션을 통째로 DROP하고
+    다음 달 파티션을 미리 만들어 둡니다.
+    """
     try:
         logger.info("로그 정리 작업 시작")
-        # 실제로는 DB에서 오래된 로그 삭제
-        # delete_old_logs(days=30)
-        logger.info("로그 정리 작업 완료")
-        return {"status": "success", "deleted_count": 0}
+        today = datetime.now(_UTC).date()
+
+        # 파티션 생성과 보관 기간 정리는 별도 트랜잭션으로 실행
+        # (생성이 실패해도 만료 파티션 DROP은 진행되도록 함)
+        created, failed = [], []
+        try:
+            with SessionLocal() as session:
+                created, failed = ensure_log_partitions(
+                    session, today, LOG_PARTITION_MONTHS_AHEAD
+                )
+                session.commit()
+        except Exception as e:
+            logger.error(f"로그 파티션 생성 실패: {str(e)}")
+        if failed:
+            # default 파티션에 해당 범위의 행이 쌓인 경우: 행을 옮긴 뒤 수동으로 생성 필요
+            logger.warning("로그 파티션 생성 실패 (default 파티션 확인 필요): %s", failed)
+
+        with SessionLocal() as session:
+            dropped = drop_expired_log_partitions(
+                session, today - timedelta(days=LOG_RETENTION_DAYS)
+            )
+            session.commit()
+
+        logger.info("로그 정리 작업 완료: 생성 %s, 삭제 %s", created, dropped)
+        return {
+            "status": "success",
+            "created_partitions": created,
+            "failed_partitions": failed,
+            "dropped_partitions": dropped,
+        }
     except Exception as e:
         logger.error(f"로그 정리 실패: {str(e)}")
         raise
@@ -92,12 +231,8 @@ def generate_daily_report():
         logger.info("일일 리포트 생성 시작")
         # 리포트 생성 로직
         report = {
-            "date": datetime.now().date().isoformat(),
-            "metrics": {
-                "total_requests": 0,
-                "error_count": 0,
-                "avg_response_time": 0
-            }
+            "date": date.today().isoformat(),
+            "metrics": dict(_EMPTY_REPORT_METRICS)
         }
         logger.info("일일 리포트 생성 완료")
         return report
@@ -0,0 +1,10 @@
+"""
+테스트 공통 설정
+프로젝트 루트 모듈을 import할 수 있게 하고, 로그 파일은 임시 디렉토리에 씁니다.
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("LOG_PATH", tempfile.mkdtemp(prefix="fastapi-service-logs-"))
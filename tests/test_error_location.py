@@ -0,0 +1,54 @@
+"""
+에러 로그 location 필드 테스트
+"""
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+class _EventCollector(logging.Handler):
+    """structlog가 stdlib 로거로 넘긴 이벤트 dict를 모음"""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def emit(self, record):
+        if isinstance(record.msg, dict):
+            self.events.append(record.msg)
+
+
+@pytest.fixture
+def error_events():
+    collector = _EventCollector()
+    main_logger = logging.getLogger("main")
+    main_logger.addHandler(collector)
+    try:
+        yield collector.events
+    finally:
+        main_logger.removeHandler(collector)
+
+
+def _location(client, events, path, event):
+    """경로를 호출하고 해당 에러 이벤트의 location을 반환"""
+    events.clear()
+    client.get(path)
+    return next(e for e in events if e["event"] == event)["error"]["location"]
+
+
+def test_location_points_at_faulting_statement(error_events):
+    with TestClient(main.app, raise_server_exceptions=False) as client:
+        null_pointer = _location(
+            client, error_events, "/test/null-pointer", "null_pointer_exception"
+        )
+        index_error = _location(
+            client, error_events, "/test/index-out-of-range", "index_out_of_range"
+        )
+
+    assert null_pointer["file"] == index_error["file"] == "main.py"
+    assert null_pointer["function"] == "_raise_null_pointer"
+    assert index_error["function"] == "_raise_index_error"
+    assert null_pointer["line"] != index_error["line"]
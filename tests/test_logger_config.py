@@ -0,0 +1,75 @@
+"""
+logger_config 테스트
+"""
+from fastapi.testclient import TestClient
+
+import logger_config
+import main
+
+
+def test_listener_runs_only_inside_lifespan():
+    # import만으로는 리스너 스레드를 시작하지 않음 (fork 안전)
+    assert not logger_config.log_listener.running
+
+    with TestClient(main.app):
+        assert logger_config.log_listener.running
+
+    assert not logger_config.log_listener.running
+
+
+class _RecordingStream:
+    """write는 보류하고 flush 시점에만 내용을 내보낸 것으로 기록하는 스트림"""
+
+    def __init__(self):
+        self.pending = []
+        self.flushed = []
+
+    def write(self, text):
+        self.pending.append(text)
+
+    def flush(self):
+        self.flushed.extend(self.pending)
+        self.pending.clear()
+
+
+def _busy_listener(**overrides):
+    """큐가 계속 차 있는 상태(부하 중)의 리스너와 출력 스트림"""
+    stream = _RecordingStream()
+    log_queue = logger_config.queue.SimpleQueue()
+    log_queue.put(None)
+    listener = logger_config._RenderingQueueListener(
+        log_queue,
+        logger_config.BatchedStreamHandler(stream),
+        formatter=logger_config.logging.Formatter("%(message)s"),
+    )
+    for name, value in overrides.items():
+        setattr(listener, name, value)
+    return listener, stream
+
+
+def _record(message):
+    return logger_config.logging.makeLogRecord({"msg": message})
+
+
+def test_busy_listener_flushes_when_buffer_exceeds_size_limit():
+    listener, stream = _busy_listener(flush_bytes=100, flush_interval=60)
+
+    listener.handle(_record("a" * 60))
+    assert stream.flushed == []
+
+    listener.handle(_record("b" * 60))
+    assert len(stream.flushed) == 2
+    assert stream.pending == []
+
+
+def test_busy_listener_flushes_when_oldest_record_exceeds_max_age(monkeypatch):
+    listener, stream = _busy_listener(flush_bytes=1 << 30, flush_interval=0.05)
+    clock = iter([100.0, 100.01, 100.06])
+    monkeypatch.setattr(logger_config.time, "monotonic", lambda: next(clock))
+
+    listener.handle(_record("first"))
+    listener.handle(_record("second"))
+    assert stream.flushed == []
+
+    listener.handle(_record("third"))
+    assert len(stream.flushed) == 3
@@ -0,0 +1,98 @@
+"""
+models 테스트 (DB 없이 생성되는 SQL/COPY 입력만 확인)
+"""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import joinedload, make_transient_to_detached
+
+import models
+
+
+class _FakeCursor:
+    def __init__(self, sink):
+        self.sink = sink
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql, buf):
+        self.sink.append((sql, buf.read()))
+
+
+class _FakeSession:
+    """psycopg2 raw 커서와 execute 호출만 흉내 내는 세션"""
+
+    def __init__(self):
+        self.copies = []
+        self.executed = []
+        sink = self.copies
+
+        class _Raw:
+            def cursor(self):
+                return _FakeCursor(sink)
+
+        class _Conn:
+            connection = _Raw()
+
+        self._conn = _Conn()
+
+    def connection(self):
+        return self._conn
+
+    def execute(self, statement, rows):
+        self.executed.append(rows)
+
+
+def _row(**extra):
+    return {"service_name": "api", "error_type": "E", "error_message": "m", **extra}
+
+
+def test_copy_always_sends_created_at_for_every_row():
+    rows = [_row()] + [_row(created_at="2025-10-01 00:00:00+00")] * models.COPY_THRESHOLD
+    session = _FakeSession()
+
+    models.bulk_insert_error_logs(session, rows)
+
+    (sql, payload), = session.copies
+    assert sql.split("(")[1].split(")")[0].endswith("created_at")
+    lines = payload.splitlines()
+    assert len(lines) == len(rows)
+    # 첫 행에 created_at이 없어도 NULL이 아닌 값으로 채워지고, 이후 행의 값도 유지됨
+    assert not lines[0].endswith(",")
+    assert lines[1].endswith('"2025-10-01 00:00:00+00"')
+
+
+def test_orm_path_rows_share_the_same_columns():
+    session = _FakeSession()
+
+    models.bulk_insert_error_logs(session, [_row(), _row(stack_trace="tb")])
+
+    first, second = session.executed[0]
+    assert first.keys() == second.keys()
+    assert first["created_at"] is not None
+
+
+
+def test_audit_log_user_requires_explicit_loading():
+    log = models.AuditLog(
+        id=1, user_id=1, action="login", resource="session",
+        created_at=datetime(2025, 10, 1, tzinfo=timezone.utc),
+    )
+    make_transient_to_detached(log)
+
+    # 암묵적 지연 로딩(N+1) 대신 즉시 에러
+    with pytest.raises(InvalidRequestError):
+        log.user
+
+    # 기본 조회에는 users JOIN이 없고, 필요할 때만 명시적으로 로드
+    dialect = postgresql.dialect()
+    assert "users" not in str(select(models.AuditLog).compile(dialect=dialect))
+    joined = select(models.AuditLog).options(joinedload(models.AuditLog.user))
+    assert "JOIN users" in str(joined.compile(dialect=dialect))